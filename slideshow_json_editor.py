@@ -4,21 +4,217 @@ JSON-based Slideshow Preview Player and Editor
 Allows users to create, edit, and preview slideshow configurations in JSON format.
 """
 
+import io
 import json
 import sys
 import os
-import subprocess
+import hashlib
+import string
+import time
 from pathlib import Path
 from datetime import datetime
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-                             QPushButton, QLabel, QTextEdit, QFileDialog, QMessageBox,
+                             QPushButton, QLabel, QPlainTextEdit, QFileDialog, QMessageBox,
                              QSplitter, QListWidget, QListWidgetItem, QDialog, QSpinBox)
-from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QFont, QPixmap, QIcon
+from PyQt5.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt5.QtGui import QFont, QPixmap, QPixmapCache, QIcon, QImage, QImageReader, QImageIOHandler
 from PyQt5.QtCore import QSize
-from PIL import Image
 import tempfile
 
+try:
+    import orjson  # Optional: faster JSON parsing and serialization
+except ImportError:
+    orjson = None
+
+try:
+    import fastjsonschema  # Optional: detailed config validation
+except ImportError:
+    fastjsonschema = None
+
+try:
+    import av  # Optional: decode video frames in-process instead of spawning ffmpeg
+except ImportError:
+    av = None
+
+# Constants
+VIDEO_FORMATS = ('.mp4', '.avi', '.mov', '.mkv')
+PREVIEW_SIZE = (400, 300)
+PIXMAP_CACHE_LIMIT_KB = 64 * 1024
+# Preview-size thumbnails; kept apart from slideshow_manager_pyqt's "thumbs", whose
+# entries are a different size and key, so neither app's size cap counts the other's files
+THUMB_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "slideshow-manager" / "previews"
+THUMB_CACHE_MAX_AGE_S = 30 * 24 * 60 * 60
+THUMB_CACHE_MAX_ENTRIES = 5000  # previews are ~20 KB each, so roughly 100 MB
+VIDEO_FRAME_BATCH = 16  # videos per FFmpeg process when warming the thumbnail cache
+
+# Default configuration, serialized once; "__NOW__" is replaced with the current timestamp
+_DEFAULT_CONFIG = {
+    "name": "My Slideshow",
+    "description": "A slideshow created with JSON editor",
+    "images": [],
+    "settings": {
+        "duration_per_image": 5,
+        "transition": "fade",
+        "resolution": "1920x1080",
+        "framerate": 30,
+        "codec": "libx264"
+    },
+    "created": "__NOW__",
+    "modified": "__NOW__"
+}
+_DEFAULT_CONFIG_JSON = json.dumps(_DEFAULT_CONFIG, indent=2)
+
+# Dark theme, applied once at QApplication level in main()
+_QSS = """
+    QMainWindow, QWidget {
+        background-color: #2b2b2b;
+        color: white;
+    }
+    QPlainTextEdit {
+        background-color: #1e1e1e;
+        color: #00ff00;
+        font-family: Courier;
+        font-size: 10px;
+    }
+    QPushButton {
+        background-color: #3d3d3d;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 6px 12px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #404040;
+    }
+    QLabel {
+        color: white;
+    }
+"""
+
+
+def _json_loads(data):
+    """Parse JSON text or bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    return json.loads(data)
+
+
+def _json_dumps(config):
+    """Serialize a config as indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=2).encode()
+
+
+def _python_literal(value):
+    """Write a list or dict as a Python literal, one item per line like json.dumps(indent=4)."""
+    if isinstance(value, dict):
+        items = [f"    {key!r}: {item!r}" for key, item in value.items()]
+        return "{\n" + ",\n".join(items) + "\n}" if items else "{}"
+    items = [f"    {item!r}" for item in value]
+    return "[\n" + ",\n".join(items) + "\n]" if items else "[]"
+
+
+def _preview_resample():
+    """Resampling filter for previews; imports PIL, so only call it when resizing."""
+    import PIL
+    from PIL import Image
+    # Pillow-SIMD releases carry a ".postN" version suffix; its vectorised LANCZOS is
+    # cheap enough to keep, otherwise BICUBIC is indistinguishable at preview size
+    return Image.Resampling.LANCZOS if ".post" in PIL.__version__ else Image.Resampling.BICUBIC
+
+
+_REQUIRED_FIELDS = ["name", "images", "settings"]
+
+_CONFIG_SCHEMA = {
+    "type": "object",
+    "required": _REQUIRED_FIELDS,
+    "properties": {
+        "name": {"type": "string"},
+        "images": {"type": "array", "items": {"type": "string"}},
+        "settings": {
+            "type": "object",
+            "properties": {
+                "duration_per_image": {"type": "number", "exclusiveMinimum": 0},
+                "transition": {"type": "string"},
+                "resolution": {"type": "string"},
+                "framerate": {"type": "number", "exclusiveMinimum": 0},
+                "codec": {"type": "string"}
+            }
+        }
+    }
+}
+
+# Compiled once at import; None falls back to the required-field check
+_validate_config = fastjsonschema.compile(_CONFIG_SCHEMA) if fastjsonschema is not None else None
+
+
+def _config_error(config):
+    """Return a description of the first problem in a config, or None if it is valid."""
+    if _validate_config is not None:
+        try:
+            _validate_config(config)
+        except fastjsonschema.JsonSchemaValueException as e:
+            return e.message
+        return None
+    if not isinstance(config, dict):
+        return "Configuration must be a JSON object"
+    missing = [f for f in _REQUIRED_FIELDS if f not in config]
+    if missing:
+        return f"Missing fields: {', '.join(missing)}"
+    # Without the schema, at least check the fields _apply_config() relies on
+    images, settings = config["images"], config["settings"]
+    if not isinstance(images, list) or not all(isinstance(p, str) for p in images):
+        return "images must be a list of file paths"
+    if not isinstance(settings, dict):
+        return "settings must be a JSON object"
+    duration = settings.get("duration_per_image", 5)
+    if isinstance(duration, bool) or not isinstance(duration, (int, float)) or duration <= 0:
+        return "settings.duration_per_image must be a positive number"
+    return None
+
+
+class _PreviewJobSignals(QObject):
+    """Signals for _PreviewJob (QRunnable cannot emit signals itself)."""
+    finished = pyqtSignal(object, object)  # (cache key, QImage or None)
+
+
+class _PreviewJob(QRunnable):
+    """Render a preview image on a pool thread so the next slide is ready in advance."""
+
+    def __init__(self, editor, key, item_path, is_video):
+        super().__init__()
+        self.render = editor._render_preview_image
+        self.key = key
+        self.item_path = item_path
+        self.is_video = is_video
+        self.signals = _PreviewJobSignals()
+        self.signals.finished.connect(editor._on_prefetch_finished)
+
+    def run(self):
+        try:
+            image = self.render(self.item_path, self.is_video)
+        except Exception:
+            image = None
+        self.signals.finished.emit(self.key, image)
+
+
+class _VideoFrameBatchJob(QRunnable):
+    """Extract first frames for a slice of a slideshow's videos on a pool thread, a batch per FFmpeg run."""
+
+    def __init__(self, editor, video_paths):
+        super().__init__()
+        self.extract = editor._cache_video_frames
+        self.video_paths = video_paths
+
+    def run(self):
+        try:
+            self.extract(self.video_paths)
+        except Exception:
+            pass  # Best effort; show_preview_image extracts on demand
+
+
 class SlideshowJsonEditor(QMainWindow):
     """JSON-based slideshow editor and preview player."""
     
@@ -28,10 +224,22 @@ class SlideshowJsonEditor(QMainWindow):
         self.setGeometry(100, 100, 1400, 800)
         
         self.current_config = {}
+        # Derived from current_config by _apply_config() so the play loop skips dict lookups
+        self._images = []
+        self._basenames = []
+        self._is_video = []
+        self._total = 0
+        self._duration_ms = 5000
         self.current_preview_index = 0
+        # Editor contents as last parsed; reparsed only after the text changes
+        self._parsed_config = None
+        self._dirty = True
+        QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT_KB)
+        self._prefetching = set()  # cache keys with a _PreviewJob in flight
         self.preview_timer = QTimer()
         self.preview_timer.timeout.connect(self.next_preview_image)
         
+        QThreadPool.globalInstance().start(self._prune_thumb_cache)
         self.setup_ui()
     
     def setup_ui(self):
@@ -48,8 +256,11 @@ class SlideshowJsonEditor(QMainWindow):
         left_label.setFont(QFont("Arial", 11, QFont.Bold))
         left_layout.addWidget(left_label)
         
-        self.json_editor = QTextEdit()
-        self.json_editor.setPlainText(json.dumps(self.get_default_config(), indent=2))
+        # Plain-text, unwrapped editor: only visible blocks are laid out
+        self.json_editor = QPlainTextEdit()
+        self.json_editor.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.json_editor.setPlainText(self.get_default_config_json())
+        self.json_editor.textChanged.connect(self._mark_dirty)
         left_layout.addWidget(self.json_editor)
         
         # Buttons for JSON editor
@@ -111,25 +322,14 @@ class SlideshowJsonEditor(QMainWindow):
         # Add panels to main layout
         main_layout.addLayout(left_layout, 1)
         main_layout.addLayout(right_layout, 1)
-        
-        self.apply_dark_theme()
     
+    def get_default_config_json(self):
+        """Get default slideshow configuration as indented JSON text."""
+        return _DEFAULT_CONFIG_JSON.replace('"__NOW__"', json.dumps(datetime.now().isoformat()))
+
     def get_default_config(self):
         """Get default slideshow configuration."""
-        return {
-            "name": "My Slideshow",
-            "description": "A slideshow created with JSON editor",
-            "images": [],
-            "settings": {
-                "duration_per_image": 5,
-                "transition": "fade",
-                "resolution": "1920x1080",
-                "framerate": 30,
-                "codec": "libx264"
-            },
-            "created": datetime.now().isoformat(),
-            "modified": datetime.now().isoformat()
-        }
+        return json.loads(self.get_default_config_json())
     
     def load_json(self):
         """Load JSON configuration from file."""
@@ -138,27 +338,49 @@ class SlideshowJsonEditor(QMainWindow):
         )
         if file_path:
             try:
-                with open(file_path, 'r') as f:
-                    config = json.load(f)
-                self.json_editor.setPlainText(json.dumps(config, indent=2))
-                self.current_config = config
+                with open(file_path, 'rb') as f:
+                    config = _json_loads(f.read())
+                self.set_editor_text(_json_dumps(config).decode())
+                self._parsed_config, self._dirty = config, False
+                self._apply_config(config)
                 self.load_preview()
                 QMessageBox.information(self, "Success", "JSON loaded successfully!")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to load JSON: {e}")
     
+    def set_editor_text(self, text):
+        """Replace the editor contents without repainting or recording undo steps."""
+        self.json_editor.setUpdatesEnabled(False)
+        self.json_editor.document().setUndoRedoEnabled(False)
+        try:
+            self.json_editor.setPlainText(text)
+        finally:
+            self.json_editor.document().setUndoRedoEnabled(True)
+            self.json_editor.setUpdatesEnabled(True)
+
+    def _mark_dirty(self):
+        """Note that the editor text no longer matches the parsed config."""
+        self._dirty = True
+
+    def _editor_config(self):
+        """Parse the editor contents, reusing the last result while the text is unchanged."""
+        if self._dirty:
+            self._parsed_config = _json_loads(self.json_editor.toPlainText())
+            self._dirty = False
+        return self._parsed_config
+
     def save_json(self):
         """Save JSON configuration to file."""
         try:
-            config = json.loads(self.json_editor.toPlainText())
-            config["modified"] = datetime.now().isoformat()
+            # Copy so the timestamp doesn't leak into the cached parse
+            config = dict(self._editor_config(), modified=datetime.now().isoformat())
             
             file_path, _ = QFileDialog.getSaveFileName(
                 self, "Save Slideshow JSON", "", "JSON Files (*.json)"
             )
             if file_path:
-                with open(file_path, 'w') as f:
-                    json.dump(config, f, indent=2)
+                with open(file_path, 'wb') as f:
+                    f.write(_json_dumps(config))
                 QMessageBox.information(self, "Success", f"JSON saved to {Path(file_path).name}")
         except json.JSONDecodeError as e:
             QMessageBox.critical(self, "Error", f"Invalid JSON: {e}")
@@ -166,24 +388,38 @@ class SlideshowJsonEditor(QMainWindow):
     def validate_json(self):
         """Validate JSON configuration."""
         try:
-            config = json.loads(self.json_editor.toPlainText())
-            self.current_config = config
-            
-            # Check required fields
-            required = ["name", "images", "settings"]
-            missing = [f for f in required if f not in config]
-            
-            if missing:
-                QMessageBox.warning(self, "Validation", f"Missing fields: {', '.join(missing)}")
+            config = self._editor_config()
+            error = _config_error(config)
+            if error:
+                QMessageBox.warning(self, "Validation", error)
             else:
+                self._apply_config(config)
                 QMessageBox.information(self, "Validation", "✓ JSON is valid!")
                 self.load_preview()
         except json.JSONDecodeError as e:
             QMessageBox.critical(self, "Error", f"Invalid JSON: {e}")
     
+    def _apply_config(self, config):
+        """Make a parsed configuration current."""
+        self.current_config = config
+        self._images = config.get("images", [])
+        self._basenames = [os.path.basename(p) for p in self._images]
+        self._is_video = [p.lower().endswith(VIDEO_FORMATS) for p in self._images]
+        self._total = len(self._images)
+        self._duration_ms = int(config.get("settings", {}).get("duration_per_image", 5) * 1000)
+
+        if av is None:
+            # Without PyAV each video frame costs an FFmpeg process; warm them all up front
+            videos = [p for p, is_video in zip(self._images, self._is_video) if is_video]
+            # One job per batch so the pool runs several FFmpeg processes at once;
+            # the low priority lets neighbour prefetches jump the queue
+            pool = QThreadPool.globalInstance()
+            for start in range(0, len(videos), VIDEO_FRAME_BATCH):
+                pool.start(_VideoFrameBatchJob(self, videos[start:start + VIDEO_FRAME_BATCH]), -1)
+
     def load_preview(self):
         """Load preview from current configuration."""
-        if not self.current_config.get("images"):
+        if not self._images:
             self.preview_label.setText("No images in configuration")
             return
         
@@ -192,62 +428,242 @@ class SlideshowJsonEditor(QMainWindow):
     
     def show_preview_image(self):
         """Show current preview image or video frame."""
-        images = self.current_config.get("images", [])
-        if not images or self.current_preview_index >= len(images):
+        if self.current_preview_index >= self._total:
             return
 
-        item_path = images[self.current_preview_index]
+        item_path = self._images[self.current_preview_index]
         try:
             # Check if it's a video file
-            video_formats = ('.mp4', '.avi', '.mov', '.mkv')
-            if Path(item_path).suffix.lower() in video_formats:
-                # Extract first frame from video
-                frame_path = self._extract_video_frame(item_path)
-                if frame_path:
-                    img = Image.open(frame_path)
-                    img.thumbnail((400, 300), Image.Resampling.LANCZOS)
-                    with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                        img.save(tmp.name)
-                        pixmap = QPixmap(tmp.name)
-                        self.preview_label.setPixmap(pixmap)
-                    os.unlink(frame_path)
-                    info = f"Video {self.current_preview_index + 1}/{len(images)}: {Path(item_path).name}"
-                else:
-                    self.preview_label.setText("📹 Could not extract video frame")
-                    info = f"Video {self.current_preview_index + 1}/{len(images)}: {Path(item_path).name}"
+            is_video = self._is_video[self.current_preview_index]
+            kind = "Video" if is_video else "Image"
+            info = f"{kind} {self.current_preview_index + 1}/{self._total}: {self._basenames[self.current_preview_index]}"
+
+            # Reuse pixmaps already rendered this session (e.g. when the play loop wraps)
+            key = self._pixmap_key(item_path)
+            pixmap = QPixmapCache.find(key)
+            if pixmap is None:
+                image = self._render_preview_image(item_path, is_video)
+                if image is not None:
+                    pixmap = QPixmap.fromImage(image)
+                    QPixmapCache.insert(key, pixmap)
+
+            if pixmap is not None:
+                self.preview_label.setPixmap(pixmap)
             else:
-                # Regular image file
-                img = Image.open(item_path)
-                img.thumbnail((400, 300), Image.Resampling.LANCZOS)
-                with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                    img.save(tmp.name)
-                    pixmap = QPixmap(tmp.name)
-                    self.preview_label.setPixmap(pixmap)
-                info = f"Image {self.current_preview_index + 1}/{len(images)}: {Path(item_path).name}"
-
+                self.preview_label.setText("📹 Could not extract video frame")
             self.preview_info.setText(info)
         except Exception as e:
             self.preview_label.setText(f"Error loading item: {e}")
-    
+
+        self._prefetch_neighbours()
+
+    def _pixmap_key(self, item_path):
+        """Get the QPixmapCache key for an item's preview (changes when the file does)."""
+        return f"{item_path}:{os.stat(item_path).st_mtime_ns}:{PREVIEW_SIZE[0]}x{PREVIEW_SIZE[1]}"
+
+    def _prefetch_neighbours(self):
+        """Render the next and previous items in the background while the current one is shown."""
+        for index in (self.current_preview_index + 1, self.current_preview_index - 1):
+            if not 0 <= index < self._total:
+                continue
+            item_path = self._images[index]
+            try:
+                key = self._pixmap_key(item_path)
+            except (OSError, TypeError):
+                continue
+            if key in self._prefetching or QPixmapCache.find(key) is not None:
+                continue
+            self._prefetching.add(key)
+            QThreadPool.globalInstance().start(_PreviewJob(self, key, item_path, self._is_video[index]))
+
+    def _on_prefetch_finished(self, key, image):
+        """Store a prefetched preview (runs on the GUI thread)."""
+        self._prefetching.discard(key)
+        if image is not None and QPixmapCache.find(key) is None:
+            QPixmapCache.insert(key, QPixmap.fromImage(image))
+
+    def _render_preview_image(self, item_path, is_video):
+        """Render the preview QImage for an item, or None if no video frame could be extracted.
+
+        Only touches QImage (not QPixmap), so it is safe to call from a pool thread.
+        """
+        if not is_video:
+            # Qt decodes its own formats straight at preview size, which is about as
+            # cheap as reading a cached thumbnail, so those never go through the cache
+            image = self._read_scaled_image(item_path)
+            if image is not None:
+                return image
+
+        # Reuse the on-disk thumbnail when present (video frames and PIL-only formats)
+        cache_path = self._thumb_cache_path(item_path, PREVIEW_SIZE)
+        image = QImage(str(cache_path)) if cache_path.exists() else QImage()
+        if not image.isNull():
+            # Mark the entry as used for _prune_thumb_cache()
+            try:
+                os.utime(cache_path)
+            except OSError:
+                pass
+            return image
+
+        if is_video:
+            img = self._extract_video_frame(item_path)
+            if img is None:
+                return None
+        else:
+            # Fall back to PIL for formats Qt has no image plugin for
+            from PIL import Image
+            img = Image.open(item_path)
+            # Let libjpeg downscale while decoding (no-op for other formats)
+            img.draft("RGB", PREVIEW_SIZE)
+        img.thumbnail(PREVIEW_SIZE, _preview_resample())
+        self._store_thumbnail(img, cache_path)
+        return self._pil_to_qimage(img)
+
+    def _read_scaled_image(self, item_path):
+        """Decode an image with Qt directly at preview size, or None if Qt can't read it."""
+        reader = QImageReader(str(item_path))
+        if not reader.canRead():
+            return None
+        # Turn photos upright from their EXIF orientation, like the manager's thumbnails
+        reader.setAutoTransform(True)
+        size = reader.size()
+        # The scaled size applies before the rotation, so fit the box in stored orientation
+        box = QSize(*PREVIEW_SIZE)
+        if reader.transformation() & QImageIOHandler.TransformationRotate90:
+            box.transpose()
+        if size.isValid() and (size.width() > box.width() or size.height() > box.height()):
+            # JPEGs are downscaled by libjpeg while decoding
+            size.scale(box, Qt.KeepAspectRatio)
+            reader.setScaledSize(size)
+        image = reader.read()
+        return None if image.isNull() else image
+
+    def _thumb_cache_path(self, item_path, size):
+        """Get the thumbnail cache file for an item, keyed by path, mtime, file size and thumbnail size."""
+        abs_path = os.path.abspath(item_path)
+        st = os.stat(abs_path)
+        key = f"{abs_path}|{st.st_mtime_ns}|{st.st_size}|{size[0]}x{size[1]}"
+        return THUMB_CACHE_DIR / (hashlib.sha1(key.encode()).hexdigest() + ".webp")
+
+    def _store_thumbnail(self, img, cache_path):
+        """Write a thumbnail into the cache atomically (best effort)."""
+        tmp_path = None
+        try:
+            THUMB_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(suffix='.webp', dir=THUMB_CACHE_DIR)
+            with os.fdopen(fd, 'wb') as f:
+                img.save(f, 'WEBP', quality=80)
+            os.replace(tmp_path, cache_path)
+        except Exception:
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    def _prune_thumb_cache(self):
+        """Keep the THUMB_CACHE_MAX_ENTRIES most recently used previews, none unused for THUMB_CACHE_MAX_AGE_S.
+
+        Runs on a pool thread; cache hits and writes set an entry's mtime.
+        """
+        try:
+            entries = [(e.stat().st_mtime, e.path) for e in os.scandir(THUMB_CACHE_DIR) if e.is_file()]
+        except OSError:
+            return
+        entries.sort(reverse=True)
+        cutoff = time.time() - THUMB_CACHE_MAX_AGE_S
+        for rank, (mtime, path) in enumerate(entries):
+            if rank >= THUMB_CACHE_MAX_ENTRIES or mtime < cutoff:
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+
+    def _pil_to_qimage(self, img):
+        """Convert a PIL image to a QImage in memory (no PNG encode/decode)."""
+        if img.mode in ("RGBA", "LA", "PA") or "transparency" in img.info:
+            img = img.convert("RGBA")
+            rawmode, fmt = "BGRA", QImage.Format_ARGB32
+        else:
+            # Opaque frames go straight to RGB32, which QPixmap uses as-is on raster
+            img = img.convert("RGB")
+            rawmode, fmt = "BGRX", QImage.Format_RGB32
+        data = img.tobytes("raw", rawmode)
+        # QImage wraps the buffer without copying; copy() detaches it from data
+        return QImage(data, img.width, img.height, img.width * 4, fmt).copy()
+
+    def _cache_video_frames(self, video_paths):
+        """Store first frames of uncached videos in the thumbnail cache (runs on a pool thread).
+
+        Each FFmpeg run opens a batch of videos as separate inputs and writes one
+        scaled frame per input, so process startup is paid once per batch.
+        """
+        import subprocess
+        from PIL import Image
+
+        pending = []
+        for video_path in video_paths:
+            try:
+                cache_path = self._thumb_cache_path(video_path, PREVIEW_SIZE)
+            except OSError:
+                continue
+            if not cache_path.exists():
+                pending.append((video_path, cache_path))
+
+        width, height = PREVIEW_SIZE
+        for start in range(0, len(pending), VIDEO_FRAME_BATCH):
+            batch = pending[start:start + VIDEO_FRAME_BATCH]
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                cmd = ['ffmpeg', '-nostdin', '-loglevel', 'error']
+                for video_path, _ in batch:
+                    cmd += ['-ss', '0', '-i', str(video_path)]
+                for i in range(len(batch)):
+                    cmd += [
+                        '-map', f'{i}:v:0', '-frames:v', '1',
+                        '-vf', f'scale={width}:{height}:force_original_aspect_ratio=decrease',
+                        os.path.join(tmp_dir, f'{i}.png')
+                    ]
+                try:
+                    subprocess.run(cmd, capture_output=True, timeout=10 + 2 * len(batch))
+                except (OSError, subprocess.TimeoutExpired):
+                    return
+
+                for i, (_, cache_path) in enumerate(batch):
+                    frame_path = os.path.join(tmp_dir, f'{i}.png')
+                    if os.path.exists(frame_path):
+                        with Image.open(frame_path) as img:
+                            self._store_thumbnail(img, cache_path)
+
     def _extract_video_frame(self, video_path):
-        """Extract first frame from video file using FFmpeg."""
+        """Extract first frame from video file as a PIL image, or None on failure."""
+        if av is not None:
+            try:
+                with av.open(str(video_path)) as container:
+                    stream = container.streams.video[0]
+                    # Only decode keyframes; the first one is all we need
+                    stream.codec_context.skip_frame = "NONKEY"
+                    frame = next(container.decode(stream))
+                    return frame.to_image()
+            except Exception:
+                pass  # Fall back to FFmpeg below
+
         try:
             import subprocess
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                tmp_path = tmp.name
-
+            from PIL import Image
+            # Seek before opening the input, scale inside FFmpeg and stream the
+            # frame over stdout instead of going through a temp file
+            width, height = PREVIEW_SIZE
             cmd = [
-                'ffmpeg', '-y', '-loglevel', 'error',
+                'ffmpeg', '-loglevel', 'error',
+                '-ss', '0',
                 '-i', str(video_path),
-                '-vf', 'select=eq(n\\,0)',
-                '-q:v', '2',
-                tmp_path
+                '-frames:v', '1',
+                '-vf', f'scale={width}:{height}:force_original_aspect_ratio=decrease',
+                '-f', 'image2pipe', '-vcodec', 'png',
+                'pipe:1'
             ]
 
             result = subprocess.run(cmd, capture_output=True, timeout=10)
 
-            if result.returncode == 0 and Path(tmp_path).exists():
-                return tmp_path
+            if result.returncode == 0 and result.stdout:
+                return Image.open(io.BytesIO(result.stdout))
             else:
                 return None
         except Exception as e:
@@ -261,15 +677,13 @@ class SlideshowJsonEditor(QMainWindow):
     
     def next_preview_image(self):
         """Show next image."""
-        images = self.current_config.get("images", [])
-        if self.current_preview_index < len(images) - 1:
+        if self.current_preview_index < self._total - 1:
             self.current_preview_index += 1
             self.show_preview_image()
     
     def play_preview(self):
         """Play preview slideshow."""
-        duration = self.current_config.get("settings", {}).get("duration_per_image", 5)
-        self.preview_timer.start(duration * 1000)
+        self.preview_timer.start(self._duration_ms)
     
     def stop_preview(self):
         """Stop preview slideshow."""
@@ -278,7 +692,7 @@ class SlideshowJsonEditor(QMainWindow):
     def export_preview_script(self):
         """Export a standalone Python script to preview the slideshow."""
         try:
-            config = json.loads(self.json_editor.toPlainText())
+            config = self._editor_config()
 
             # Validate configuration
             if not config.get("images"):
@@ -306,10 +720,27 @@ class SlideshowJsonEditor(QMainWindow):
         """Generate a preview script from configuration."""
         images = config.get("images", [])
         settings = config.get("settings", {})
-        duration = settings.get("duration_per_image", 5)
         name = config.get("name", "Slideshow")
 
-        script = '''#!/usr/bin/env python3
+        script_settings = {
+            "duration_per_image": settings.get("duration_per_image", 5),
+            "transition": settings.get("transition", "fade"),
+            "resolution": settings.get("resolution", "1920x1080"),
+            "framerate": settings.get("framerate", 30),
+            "codec": settings.get("codec", "libx264")
+        }
+
+        # repr() writes Python literals (None/True/False rather than JSON's null/true/false)
+        # and handles quoting and escaping of paths in one pass
+        indent = "\n        "
+        return _PREVIEW_SCRIPT_TEMPLATE.substitute(
+            name=repr(name),
+            images=_python_literal(images).replace("\n", indent),
+            settings=_python_literal(script_settings).replace("\n", indent),
+        )
+
+# Standalone preview script written by export_preview_script()
+_PREVIEW_SCRIPT_TEMPLATE = string.Template('''#!/usr/bin/env python3
 """
 Auto-generated Slideshow Preview Script
 Created from JSON configuration
@@ -321,9 +752,26 @@ from pathlib import Path
 from datetime import datetime
 from PyQt5.QtWidgets import QApplication, QMainWindow, QLabel, QVBoxLayout, QWidget, QPushButton, QHBoxLayout
 from PyQt5.QtCore import Qt, QTimer, QSize
-from PyQt5.QtGui import QPixmap, QFont
+from PyQt5.QtGui import QPixmap, QFont, QImage
 from PIL import Image
-import tempfile
+
+QSS = """
+    QMainWindow, QWidget {
+        background-color: #2b2b2b;
+        color: white;
+    }
+    QPushButton {
+        background-color: #3d3d3d;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #404040;
+    }
+"""
 
 class SlideshowPreview(QMainWindow):
     """Preview player for slideshow configuration."""
@@ -383,27 +831,6 @@ class SlideshowPreview(QMainWindow):
         layout.addLayout(btn_layout)
 
         central_widget.setLayout(layout)
-        self.apply_dark_theme()
-
-    def apply_dark_theme(self):
-        """Apply dark theme."""
-        self.setStyleSheet("""
-            QMainWindow, QWidget {
-                background-color: #2b2b2b;
-                color: white;
-            }
-            QPushButton {
-                background-color: #3d3d3d;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #404040;
-            }
-        """)
 
     def load_image(self):
         """Load and display current image."""
@@ -413,12 +840,14 @@ class SlideshowPreview(QMainWindow):
         img_path = self.images[self.current_index]
         try:
             img = Image.open(img_path)
-            img.thumbnail((600, 400), Image.Resampling.LANCZOS)
+            img.draft("RGB", (600, 400))
+            img.thumbnail((600, 400), Image.Resampling.BICUBIC)
+            img = img.convert("RGBA")
 
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                img.save(tmp.name)
-                pixmap = QPixmap(tmp.name)
-                self.image_label.setPixmap(pixmap)
+            # Build the QImage straight from the pixel buffer (no temp PNG)
+            self._buffer = img.tobytes("raw", "RGBA")
+            qimg = QImage(self._buffer, img.width, img.height, img.width * 4, QImage.Format_RGBA8888)
+            self.image_label.setPixmap(QPixmap.fromImage(qimg))
 
             duration = self.settings.get("duration_per_image", 5)
             total_duration = len(self.images) * duration
@@ -463,24 +892,12 @@ class SlideshowPreview(QMainWindow):
 
 def main():
     app = QApplication(sys.argv)
+    app.setStyleSheet(QSS)
 
     config = {
-        "name": "''' + name + '''",
-        "images": [
-'''
-
-        # Add images to script
-        for img in images:
-            script += f'            "{img}",\n'
-
-        script += '''        ],
-        "settings": {
-            "duration_per_image": ''' + str(duration) + ''',
-            "transition": "''' + settings.get("transition", "fade") + '''",
-            "resolution": "''' + settings.get("resolution", "1920x1080") + '''",
-            "framerate": ''' + str(settings.get("framerate", 30)) + ''',
-            "codec": "''' + settings.get("codec", "libx264") + '''"
-        }
+        "name": $name,
+        "images": $images,
+        "settings": $settings
     }
 
     preview = SlideshowPreview(config)
@@ -489,41 +906,12 @@ def main():
 
 if __name__ == '__main__':
     main()
-'''
-
-        return script
-
-    def apply_dark_theme(self):
-        """Apply dark theme."""
-        self.setStyleSheet("""
-            QMainWindow, QWidget {
-                background-color: #2b2b2b;
-                color: white;
-            }
-            QTextEdit {
-                background-color: #1e1e1e;
-                color: #00ff00;
-                font-family: Courier;
-                font-size: 10px;
-            }
-            QPushButton {
-                background-color: #3d3d3d;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 6px 12px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #404040;
-            }
-            QLabel {
-                color: white;
-            }
-        """)
+''')
 
 def main():
     app = QApplication(sys.argv)
+    # Parsed once for the whole application rather than per window
+    app.setStyleSheet(_QSS)
     window = SlideshowJsonEditor()
     window.show()
     sys.exit(app.exec_())
@@ -26,29 +26,63 @@ New in v2.0 (2025-10-28):
 
 import os
 import sys
+import errno
+import asyncio
 import subprocess
 import shutil
+import shlex
 from datetime import datetime
 from pathlib import Path
 import json
+import queue
 import threading
+import time
 import logging
 import traceback
-from io import StringIO
+from io import StringIO, BytesIO
 import tempfile
 import sqlite3
+import hashlib
+import importlib.util
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from collections import OrderedDict, deque
+from contextlib import contextmanager
 
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QPushButton, QLabel, QListWidget, QListWidgetItem, QFileDialog,
                              QDialog, QLineEdit, QComboBox, QSpinBox, QCheckBox, QTabWidget,
                              QScrollArea, QGridLayout, QSplitter, QMessageBox, QInputDialog,
                              QTextEdit, QPlainTextEdit, QSlider, QFrame)
-from PyQt5.QtCore import Qt, QSize, QThread, pyqtSignal, QTimer, QRect, QMimeData, QPoint
-from PyQt5.QtGui import QIcon, QPixmap, QFont, QColor, QPalette, QImage, QDrag, QPainter
+from PyQt5.QtCore import (Qt, QSize, QThread, pyqtSignal, QTimer, QRect, QMimeData, QPoint, QObject, QProcess,
+                          QRunnable, QThreadPool)
+from PyQt5.QtGui import QIcon, QPixmap, QPixmapCache, QFont, QColor, QPalette, QImage, QDrag, QPainter
 from PyQt5.QtCore import QPropertyAnimation, QEasingCurve
 
-from PIL import Image
-import vlc
+import PIL
+from PIL import Image, ImageOps, features
+
+try:
+    import av  # Optional: decode video first frames in-process instead of spawning ffmpeg
+except ImportError:
+    av = None
+
+
+def _lazy_import(name):
+    """Import a module whose body only runs on first attribute access."""
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ImportError(f"No module named '{name}'")
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+# libvlc and its plugin graph are loaded on first playback rather than at startup
+vlc = _lazy_import("vlc")
 
 # Configure logging - output to console for visibility
 logging.basicConfig(
@@ -65,10 +99,108 @@ logger = logging.getLogger(__name__)
 IMAGES_DIR = Path.home() / "Pictures" / "Screenshots"
 OUTPUT_DIR = Path.home() / "Pictures" / "Screenshots"
 CONFIG_FILE = Path.home() / ".slideshow_config.json"
+CONFIG_SAVE_DELAY_MS = 2000  # config changes within this window are written once
 DB_FILE = Path.home() / ".slideshow_scripts.db"
+SCHEMA_VERSION = 3  # PRAGMA user_version of DB_FILE once its tables exist
 THUMBNAIL_SIZE = (120, 120)
-SUPPORTED_FORMATS = ('.png', '.jpg', '.jpeg', '.bmp', '.gif', '.webp')
-VIDEO_FORMATS = ('.mp4', '.avi', '.mov', '.mkv')
+THUMBNAIL_COLUMNS = 6  # gallery grid width
+THUMBNAIL_PREFETCH_ROWS = 2  # rows above/below the viewport loaded ahead of the rest
+# Lowercase suffixes; only ever used for membership tests
+SUPPORTED_FORMATS = frozenset({'.png', '.jpg', '.jpeg', '.bmp', '.gif', '.webp'})
+VIDEO_FORMATS = frozenset({'.mp4', '.avi', '.mov', '.mkv'})
+# Pillow-SIMD releases carry a ".postN" version suffix; its vectorised LANCZOS is
+# cheap enough to keep, otherwise BICUBIC is indistinguishable at thumbnail size
+PILLOW_SIMD = ".post" in PIL.__version__
+THUMBNAIL_RESAMPLE = Image.Resampling.LANCZOS if PILLOW_SIMD else Image.Resampling.BICUBIC
+# Decoded thumbnails persist across runs (shared with the JSON editor's previews)
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "slideshow-manager"
+CACHE_MAX_AGE_S = 30 * 24 * 60 * 60  # cached files unused this long are pruned at startup
+THUMB_CACHE_DIR = CACHE_DIR / "thumbs"
+THUMB_CACHE_MAX_BYTES = 200 * 1024 * 1024
+# Full-size first frames of videos, reused by thumbnails and the slideshow builder
+FRAME_CACHE_DIR = CACHE_DIR / "frames"
+FRAME_CACHE_MAX_BYTES = 500 * 1024 * 1024
+# Scratch dirs for slideshow frame symlinks, under tempfile.gettempdir(); ones older
+# than STALE_TEMP_MAX_AGE_S were left by a crashed run and are removed at startup
+SLIDESHOW_TEMP_PREFIX = "slideshow-manager-"
+STALE_TEMP_MAX_AGE_S = 60 * 60
+SLIDESHOW_TIMEOUT_S = 300  # wall-clock limit for the slideshow FFmpeg run
+STDERR_TAIL_LINES = 200  # FFmpeg stderr lines kept for the error dialog
+VIDEO_FRAME_CACHE_ENTRIES = 256  # in-memory {video: frame path} LRU; misses fall back to FRAME_CACHE_DIR
+# In-memory thumbnail budget (QPixmapCache, LRU; misses fall back to THUMB_CACHE_DIR).
+# Pixmaps stay 32-bit: the raster backend converts RGB16 images back to the
+# screen format, so only the budget bounds their memory.
+PIXMAP_CACHE_LIMIT_KB = 64 * 1024
+EXPORT_NICENESS = 10  # exports run below the UI's CPU priority
+FRAME_BATCH_SIZE = 16  # videos per ffmpeg first-frame run (keeps the argv short)
+VIDEO_THUMBNAIL_WORKERS = min(4, os.cpu_count() or 1)  # concurrent first-frame batches
+BACKGROUND_WORKERS = min(4, os.cpu_count() or 2)  # shared executor for exports and slideshows
+PROBE_JOBS = 8  # ffprobe processes run at once by probe_streams_many()
+# ffmpeg scales thumbnail frames to 2x THUMBNAIL_SIZE with its cheapest scaler;
+# THUMBNAIL_RESAMPLE does the final, better-filtered step
+THUMBNAIL_FRAME_SIZE = (THUMBNAIL_SIZE[0] * 2, THUMBNAIL_SIZE[1] * 2)
+
+# Gallery thumbnail borders; built once so selection changes only swap strings
+_THUMB_QSS = """
+    QPushButton {{
+        border: {width} solid {color};
+        border-radius: 4px;
+        padding: 0px;
+        background-color: #2b2b2b;
+    }}
+    QPushButton:hover {{
+        border: 4px solid #4a9eff;
+    }}
+"""
+_THUMB_QSS_NORMAL = _THUMB_QSS.format(width="2px", color="#3d3d3d")
+_THUMB_QSS_SELECTED = _THUMB_QSS.format(width="4px", color="#00ff00")
+_VIDEO_GRID_QSS = """
+    QPushButton {{
+        background-color: #2a2a2a;
+        border: {width} solid {color};
+        border-radius: 8px;
+        color: white;
+        font-size: 14px;
+    }}
+    QPushButton:hover {{
+        border: 4px solid #4a9eff;
+        background-color: #3a3a3a;
+    }}
+"""
+_VIDEO_GRID_QSS_NORMAL = _VIDEO_GRID_QSS.format(width="2px", color="#3a3a3a")
+_VIDEO_GRID_QSS_SELECTED = _VIDEO_GRID_QSS.format(width="4px", color="#00ff00")
+
+
+# Query text is kept constant so sqlite3's per-connection statement cache reuses the plans
+# Upserts need SQLite 3.24+
+_SQL_SAVE_SCRIPT = (
+    'INSERT INTO ffmpeg_scripts (name, description, command, argv, created_at, modified_at) '
+    'VALUES (?, ?, ?, ?, ?, ?) '
+    'ON CONFLICT(name) DO UPDATE SET command = excluded.command, argv = excluded.argv, '
+    'description = excluded.description, modified_at = excluded.modified_at'
+)
+_SQL_GET_SCRIPT = (
+    'SELECT id, name, description, command, created_at, modified_at, times_used, argv '
+    'FROM ffmpeg_scripts WHERE name = ?'
+)
+_SQL_LIST_SCRIPTS = 'SELECT name, description, modified_at, times_used FROM ffmpeg_scripts ORDER BY modified_at DESC'
+_SQL_DELETE_SCRIPT = 'DELETE FROM ffmpeg_scripts WHERE name = ?'
+_SQL_INCREMENT_USAGE = 'UPDATE ffmpeg_scripts SET times_used = times_used + 1 WHERE name = ?'
+_SQL_SAVE_PLAYLIST = (
+    'INSERT INTO playlists (name, description, video_paths, created_at, modified_at) '
+    'VALUES (?, ?, ?, ?, ?) '
+    'ON CONFLICT(name) DO UPDATE SET video_paths = excluded.video_paths, '
+    'description = excluded.description, modified_at = excluded.modified_at'
+)
+_SQL_GET_PLAYLIST = (
+    'SELECT id, name, description, video_paths, created_at, modified_at '
+    'FROM playlists WHERE name = ?'
+)
+_SQL_LIST_PLAYLISTS = 'SELECT name, description, modified_at FROM playlists ORDER BY modified_at DESC'
+_SQL_DELETE_PLAYLIST = 'DELETE FROM playlists WHERE name = ?'
+_SQL_GET_PROBE = 'SELECT json FROM probe_cache WHERE path = ? AND mtime = ? AND size = ?'
+_SQL_DELETE_PROBES = 'DELETE FROM probe_cache WHERE path = ?'
+_SQL_SAVE_PROBE = 'INSERT INTO probe_cache (path, mtime, size, json) VALUES (?, ?, ?, ?)'
 
 
 class FFmpegScriptDatabase:
@@ -76,75 +208,104 @@ class FFmpegScriptDatabase:
 
     def __init__(self, db_path=DB_FILE):
         self.db_path = db_path
+        # One connection for the lifetime of the app, in autocommit mode;
+        # use transaction() to group several writes into a single commit
+        self.conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('PRAGMA temp_store=MEMORY')
+        self.conn.execute('PRAGMA cache_size=-20000')
+        # list_scripts()/list_playlists() results, dropped on every write
+        self._scripts_cache = None
+        self._playlists_cache = None
         self.init_database()
 
+    @contextmanager
+    def transaction(self):
+        """Run the enclosed statements in one transaction (nested calls join the outer one)."""
+        if self.conn.in_transaction:
+            yield
+            return
+        self.conn.execute('BEGIN')
+        try:
+            yield
+        except BaseException:
+            self.conn.execute('ROLLBACK')
+            self._scripts_cache = self._playlists_cache = None
+            raise
+        self.conn.execute('COMMIT')
+
     def init_database(self):
-        """Initialize database with required tables."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        # Table for FFmpeg scripts
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS ffmpeg_scripts (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL UNIQUE,
-                description TEXT,
-                command TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                modified_at TEXT NOT NULL,
-                times_used INTEGER DEFAULT 0
-            )
-        ''')
-
-        # Table for video playlists
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS playlists (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL UNIQUE,
-                description TEXT,
-                video_paths TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                modified_at TEXT NOT NULL
-            )
-        ''')
+        """Create tables and indexes, unless the schema is already at SCHEMA_VERSION."""
+        if self.conn.execute('PRAGMA user_version').fetchone()[0] >= SCHEMA_VERSION:
+            return
 
-        conn.commit()
-        conn.close()
-        logger.info(f"Database initialized at {self.db_path}")
+        # executescript() commits any open transaction first, so the schema script
+        # issues its own BEGIN and is rolled back by hand if a statement fails
+        try:
+            self.conn.executescript('''
+                BEGIN;
+
+                -- Table for FFmpeg scripts
+                CREATE TABLE IF NOT EXISTS ffmpeg_scripts (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT NOT NULL UNIQUE,
+                    description TEXT,
+                    command TEXT NOT NULL,
+                    argv TEXT,  -- JSON argv that command runs, when it needs no shell
+                    created_at TEXT NOT NULL,
+                    modified_at TEXT NOT NULL,
+                    times_used INTEGER DEFAULT 0
+                );
+
+                -- Table for video playlists
+                CREATE TABLE IF NOT EXISTS playlists (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT NOT NULL UNIQUE,
+                    description TEXT,
+                    video_paths TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    modified_at TEXT NOT NULL
+                );
+
+                -- ffprobe stream parameters; a changed file no longer matches its row
+                CREATE TABLE IF NOT EXISTS probe_cache (
+                    path TEXT NOT NULL,
+                    mtime INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    json TEXT NOT NULL,
+                    PRIMARY KEY (path, mtime, size)
+                );
+
+                -- Let the list_* queries walk an index instead of sorting
+                CREATE INDEX IF NOT EXISTS idx_scripts_modified ON ffmpeg_scripts(modified_at DESC);
+                CREATE INDEX IF NOT EXISTS idx_playlists_modified ON playlists(modified_at DESC);
+            ''')
+            # Tables created before SCHEMA_VERSION 3 lack the argv column
+            columns = {row[1] for row in self.conn.execute('PRAGMA table_info(ffmpeg_scripts)')}
+            if 'argv' not in columns:
+                self.conn.execute('ALTER TABLE ffmpeg_scripts ADD COLUMN argv TEXT')
+            self.conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+            self.conn.execute('COMMIT')
+        except sqlite3.Error:
+            if self.conn.in_transaction:
+                self.conn.execute('ROLLBACK')
+            raise
 
-    def save_script(self, name, command, description=""):
-        """Save or update an FFmpeg script."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        logger.info(f"Database initialized at {self.db_path}")
 
+    def save_script(self, name, command, description="", argv=None):
+        """Save or update an FFmpeg script, with the argv it runs if it needs no shell."""
         now = datetime.now().isoformat()
+        argv_json = json.dumps(argv) if argv else None
+        self.conn.execute(_SQL_SAVE_SCRIPT, (name, description, command, argv_json, now, now))
+        self._scripts_cache = None
 
-        try:
-            cursor.execute('''
-                INSERT INTO ffmpeg_scripts (name, description, command, created_at, modified_at)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (name, description, command, now, now))
-        except sqlite3.IntegrityError:
-            # Update existing script
-            cursor.execute('''
-                UPDATE ffmpeg_scripts
-                SET command = ?, description = ?, modified_at = ?
-                WHERE name = ?
-            ''', (command, description, now, name))
-
-        conn.commit()
-        conn.close()
         logger.info(f"Saved FFmpeg script: {name}")
 
     def get_script(self, name):
         """Get an FFmpeg script by name."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('SELECT * FROM ffmpeg_scripts WHERE name = ?', (name,))
-        result = cursor.fetchone()
-
-        conn.close()
+        result = self.conn.execute(_SQL_GET_SCRIPT, (name,)).fetchone()
 
         if result:
             return {
@@ -154,76 +315,41 @@ class FFmpegScriptDatabase:
                 'command': result[3],
                 'created_at': result[4],
                 'modified_at': result[5],
-                'times_used': result[6]
+                'times_used': result[6],
+                'argv': json.loads(result[7]) if result[7] else None
             }
         return None
 
     def list_scripts(self):
         """List all FFmpeg scripts."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('SELECT name, description, modified_at, times_used FROM ffmpeg_scripts ORDER BY modified_at DESC')
-        results = cursor.fetchall()
-
-        conn.close()
-        return results
+        if self._scripts_cache is None:
+            self._scripts_cache = self.conn.execute(_SQL_LIST_SCRIPTS).fetchall()
+        return self._scripts_cache
 
     def delete_script(self, name):
         """Delete an FFmpeg script."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('DELETE FROM ffmpeg_scripts WHERE name = ?', (name,))
-
-        conn.commit()
-        conn.close()
+        self.conn.execute(_SQL_DELETE_SCRIPT, (name,))
+        self._scripts_cache = None
         logger.info(f"Deleted FFmpeg script: {name}")
 
     def increment_usage(self, name):
         """Increment usage counter for a script."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('UPDATE ffmpeg_scripts SET times_used = times_used + 1 WHERE name = ?', (name,))
-
-        conn.commit()
-        conn.close()
+        self.conn.execute(_SQL_INCREMENT_USAGE, (name,))
+        self._scripts_cache = None
 
     def save_playlist(self, name, video_paths, description=""):
         """Save or update a video playlist."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
         now = datetime.now().isoformat()
-        video_paths_json = json.dumps(video_paths)
+        # Compact UTF-8 JSON stored as a BLOB; get_playlist also reads older TEXT rows
+        video_paths_json = json.dumps(video_paths, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        self.conn.execute(_SQL_SAVE_PLAYLIST, (name, description, video_paths_json, now, now))
+        self._playlists_cache = None
 
-        try:
-            cursor.execute('''
-                INSERT INTO playlists (name, description, video_paths, created_at, modified_at)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (name, description, video_paths_json, now, now))
-        except sqlite3.IntegrityError:
-            # Update existing playlist
-            cursor.execute('''
-                UPDATE playlists
-                SET video_paths = ?, description = ?, modified_at = ?
-                WHERE name = ?
-            ''', (video_paths_json, description, now, name))
-
-        conn.commit()
-        conn.close()
         logger.info(f"Saved playlist: {name}")
 
     def get_playlist(self, name):
         """Get a playlist by name."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('SELECT * FROM playlists WHERE name = ?', (name,))
-        result = cursor.fetchone()
-
-        conn.close()
+        result = self.conn.execute(_SQL_GET_PLAYLIST, (name,)).fetchone()
 
         if result:
             return {
@@ -238,25 +364,386 @@ class FFmpegScriptDatabase:
 
     def list_playlists(self):
         """List all playlists."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('SELECT name, description, modified_at FROM playlists ORDER BY modified_at DESC')
-        results = cursor.fetchall()
-
-        conn.close()
-        return results
+        if self._playlists_cache is None:
+            self._playlists_cache = self.conn.execute(_SQL_LIST_PLAYLISTS).fetchall()
+        return self._playlists_cache
 
     def delete_playlist(self, name):
         """Delete a playlist."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        self.conn.execute(_SQL_DELETE_PLAYLIST, (name,))
+        self._playlists_cache = None
+        logger.info(f"Deleted playlist: {name}")
+
+    def cached_probes(self, paths):
+        """Look up cached probes; returns ({path: streams}, {path: cache key} of videos still to probe)."""
+        results = {}
+        misses = {}  # {path: cache key}
+        for path in paths:
+            abs_path = os.path.abspath(path)
+            try:
+                st = os.stat(abs_path)
+            except OSError:
+                results[path] = None
+                continue
+            key = (abs_path, st.st_mtime_ns, st.st_size)
+            row = self.conn.execute(_SQL_GET_PROBE, key).fetchone()
+            if row:
+                results[path] = json.loads(row[0])
+            else:
+                misses[path] = key
+        return results, misses
+
+    def save_probes(self, misses, probed):
+        """Cache probe_streams_many() results for the misses cached_probes() returned."""
+        with self.transaction():
+            for path, streams in probed.items():
+                if streams is not None:
+                    self._save_probe(misses[path], streams)
+
+    def _save_probe(self, key, streams):
+        self.conn.execute(_SQL_DELETE_PROBES, (key[0],))
+        self.conn.execute(_SQL_SAVE_PROBE, key + (json.dumps(streams, separators=(",", ":")),))
+
+
+class ThumbnailCache:
+    """On-disk WebP thumbnail cache keyed by file path, mtime, file size and thumbnail size.
+
+    With size=None it holds full-size images (see FRAME_CACHE_DIR), stored with
+    the given suffix.
+    """
+
+    def __init__(self, cache_dir=THUMB_CACHE_DIR, size=THUMBNAIL_SIZE, suffix=".webp"):
+        self.cache_dir = Path(cache_dir)
+        self.size = size
+        self.suffix = suffix
+
+    def path_for(self, file_path):
+        """Get the cache file for a source file (a new one whenever the source changes)."""
+        abs_path = os.path.abspath(file_path)
+        st = os.stat(abs_path)
+        size = f"{self.size[0]}x{self.size[1]}" if self.size else "full"
+        # File size too: copies that preserve mtime (cp -p, rsync -t) still change it
+        key = f"{abs_path}|{st.st_mtime_ns}|{st.st_size}|{size}"
+        return self.cache_dir / (hashlib.blake2b(key.encode(), digest_size=16).hexdigest() + self.suffix)
+
+    def load(self, file_path):
+        """Load a cached thumbnail as a QPixmap, or None if it isn't cached."""
+        try:
+            cache_path = self.path_for(file_path)
+        except OSError:
+            return None
+        if not cache_path.exists():
+            return None
+        pixmap = QPixmap(str(cache_path))
+        if pixmap.isNull():
+            return None
+        self.mark_used(cache_path)
+        return pixmap
 
-        cursor.execute('DELETE FROM playlists WHERE name = ?', (name,))
+    def contains(self, file_path):
+        """Check whether a thumbnail for the file's current version is cached."""
+        try:
+            cache_path = self.path_for(file_path)
+        except OSError:
+            return False
+        if not cache_path.exists():
+            return False
+        self.mark_used(cache_path)
+        return True
+
+    def load_bytes(self, file_path):
+        """Read a cached thumbnail's WebP data, or None if it isn't cached."""
+        try:
+            cache_path = self.path_for(file_path)
+            data = cache_path.read_bytes()
+        except OSError:
+            return None
+        self.mark_used(cache_path)
+        return data
 
-        conn.commit()
-        conn.close()
-        logger.info(f"Deleted playlist: {name}")
+    @staticmethod
+    def mark_used(cache_path):
+        """Record a cache hit in the entry's mtime, which prune() evicts by.
+
+        atime can't be relied on for this: noatime mounts never update it and
+        relatime ones only about once a day.
+        """
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+
+    def store(self, file_path, pil_image):
+        """Write a thumbnail into the cache atomically (best effort) and return its WebP data."""
+        buffer = BytesIO()
+        pil_image.save(buffer, 'WEBP', quality=85)
+        data = buffer.getvalue()
+        self.store_bytes(file_path, data)
+        return data
+
+    def store_bytes(self, file_path, data):
+        """Write already-encoded WebP thumbnail data into the cache atomically (best effort)."""
+        tmp_path = None
+        try:
+            cache_path = self.path_for(file_path)
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(suffix=self.suffix, dir=self.cache_dir)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.debug(f"Could not cache thumbnail for {file_path}: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    def prune(self, max_bytes=THUMB_CACHE_MAX_BYTES, max_age=CACHE_MAX_AGE_S):
+        """Evict thumbnails unused for max_age seconds, then least recently used ones beyond max_bytes.
+
+        Entries are aged by mtime, which writes and mark_used() keep at the time of last use.
+        """
+        try:
+            entries = [(e.path, e.stat()) for e in os.scandir(self.cache_dir) if e.is_file()]
+        except OSError:
+            return
+        total = sum(st.st_size for _, st in entries)
+        cutoff = time.time() - max_age
+        # Oldest first: anything unused past the cutoff goes, then more until under the cap
+        for path, st in sorted(entries, key=lambda entry: entry[1].st_mtime):
+            if total <= max_bytes and st.st_mtime >= cutoff:
+                break
+            try:
+                os.unlink(path)
+                total -= st.st_size
+            except OSError:
+                pass
+
+
+def _thumbnail_image(img_path):
+    """Decode an image at thumbnail size, turned upright according to its EXIF orientation."""
+    with Image.open(img_path) as img:
+        # Let libjpeg decode at a reduced scale instead of full resolution
+        img.draft("RGB", THUMBNAIL_SIZE)
+        img.thumbnail(THUMBNAIL_SIZE, THUMBNAIL_RESAMPLE)
+        return ImageOps.exif_transpose(img)
+
+
+def _make_thumb(img_path):
+    """Decode an image into WebP thumbnail bytes and cache them on disk (runs in a worker process)."""
+    img = _thumbnail_image(img_path)
+    buffer = BytesIO()
+    img.save(buffer, 'WEBP', quality=85)
+    data = buffer.getvalue()
+    ThumbnailCache().store_bytes(img_path, data)
+    return data
+
+
+# Stream parameters that have to match across inputs for the concat demuxer to stream copy
+_PROBE_ENTRIES = ("stream=codec_type,codec_name,profile,time_base,sample_aspect_ratio,pix_fmt,"
+                  "r_frame_rate,width,height,sample_rate,channels")
+
+
+async def _probe_streams_async(video_path, slots):
+    """Get a video's stream parameters from ffprobe, or None if it can't be probed.
+
+    slots limits how many ffprobe processes run at once.
+    """
+    async with slots:
+        try:
+            process = await asyncio.create_subprocess_exec(
+                "ffprobe", "-v", "error", "-show_entries", _PROBE_ENTRIES, "-of", "json", str(video_path),
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            )
+        except OSError as e:
+            logger.debug(f"Could not probe {video_path}: {e}")
+            return None
+        try:
+            stdout, _ = await asyncio.wait_for(process.communicate(), timeout=30)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            logger.debug(f"Could not probe {video_path}: ffprobe timed out")
+            return None
+    if process.returncode != 0:
+        logger.debug(f"Could not probe {video_path}: ffprobe exited with {process.returncode}")
+        return None
+    try:
+        return json.loads(stdout).get("streams", [])
+    except ValueError as e:
+        logger.debug(f"Could not probe {video_path}: {e}")
+        return None
+
+
+def probe_streams_many(video_paths):
+    """Probe several videos, up to PROBE_JOBS at once; returns {path: streams or None}."""
+    async def probe_all():
+        slots = asyncio.Semaphore(PROBE_JOBS)
+        return await asyncio.gather(*(_probe_streams_async(path, slots) for path in video_paths))
+
+    return dict(zip(video_paths, asyncio.run(probe_all())))
+
+
+# Re-encode settings as (global args, per-input args, video encoder args, filter
+# appended to the video chain); hardware encoders are listed in order of preference
+_SOFTWARE_ENCODER = ([], [], ['-c:v', 'libx264', '-preset', 'medium', '-crf', '23'], "")
+HW_ENCODERS = {
+    "h264_nvenc": ([], ['-hwaccel', 'auto'], ['-c:v', 'h264_nvenc', '-preset', 'p4', '-cq', '23'], ""),
+    "h264_qsv": ([], ['-hwaccel', 'auto'], ['-c:v', 'h264_qsv', '-global_quality', '23'], ""),
+    "h264_videotoolbox": ([], ['-hwaccel', 'auto'], ['-c:v', 'h264_videotoolbox', '-q:v', '65'], ""),
+    "h264_vaapi": (['-vaapi_device', '/dev/dri/renderD128'], [], ['-c:v', 'h264_vaapi', '-qp', '23'],
+                   "format=nv12,hwupload"),
+}
+
+
+def detect_hw_encoder():
+    """Get the first HW_ENCODERS entry that ffmpeg can actually encode with here, or None."""
+    try:
+        listed = subprocess.run(["ffmpeg", "-hide_banner", "-encoders"],
+                                capture_output=True, text=True, timeout=10).stdout.split()
+    except (OSError, subprocess.SubprocessError):
+        return None
+    for name, (global_args, _, video_args, video_filter) in HW_ENCODERS.items():
+        if name not in listed:
+            continue
+        # Being compiled in says nothing about the GPU or driver: encode one test frame
+        argv = ["ffmpeg", "-hide_banner", "-loglevel", "error", *global_args,
+                "-f", "lavfi", "-i", "color=size=256x256:duration=0.1"]
+        if video_filter:
+            argv += ["-vf", video_filter]
+        argv += ["-frames:v", "1", *video_args, "-f", "null", "-"]
+        try:
+            subprocess.run(argv, capture_output=True, timeout=10, check=True)
+        except (OSError, subprocess.SubprocessError):
+            continue
+        logger.info(f"Hardware encoder available: {name}")
+        return name
+    return None
+
+
+_NICE = shutil.which("nice")
+
+
+def low_priority(argv):
+    """Prefix an export command line with nice so encoding doesn't starve the UI (POSIX)."""
+    if _NICE:
+        return [_NICE, "-n", str(EXPORT_NICENESS)] + argv
+    return argv
+
+
+# Windows has no nice; lower the priority class of the fallback subprocess exports instead
+_LOW_PRIORITY_FLAGS = subprocess.BELOW_NORMAL_PRIORITY_CLASS if sys.platform == "win32" else 0
+
+
+def shell_command(*arg_groups):
+    """Quote argv groups as one shell command, each group on its own continuation line."""
+    return " \\\n  ".join(shlex.join(group) for group in arg_groups)
+
+
+def split_command(command):
+    """Split a shell command into argv, or return None if it needs a real shell.
+
+    Commands with operators (pipes, redirects, ;, &&), substitutions, ~, comments,
+    line breaks, leading VAR=value assignments or unquoted glob/brace characters
+    (* ? [ {) are left to sh; plain commands, including quoted filter graphs, run
+    without one.
+    """
+    if any(ch in command for ch in "$`#\n"):
+        return None
+    quote = None
+    for ch in command:
+        if quote:
+            if ch == quote:
+                quote = None
+        elif ch in "'\"":
+            quote = ch
+        elif ch in "*?[{":  # sh would expand these
+            return None
+    lexer = shlex.shlex(command, posix=True, punctuation_chars=True)
+    lexer.whitespace_split = True
+    try:
+        if any(set(token) <= set(lexer.punctuation_chars) for token in lexer):
+            return None
+        argv = shlex.split(command)
+    except ValueError:  # unbalanced quotes; let sh report it
+        return None
+    if not argv or any(arg.startswith("~") for arg in argv):
+        return None
+    name, sep, _ = argv[0].partition("=")
+    if sep and name.isidentifier():
+        return None
+    return argv
+
+
+def remove_stale_temp_dirs(max_age=STALE_TEMP_MAX_AGE_S):
+    """Delete slideshow scratch dirs that earlier runs left behind (e.g. after a crash)."""
+    cutoff = time.time() - max_age
+    try:
+        entries = list(os.scandir(tempfile.gettempdir()))
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if (entry.name.startswith(SLIDESHOW_TEMP_PREFIX) and entry.is_dir(follow_symlinks=False)
+                    and entry.stat(follow_symlinks=False).st_mtime < cutoff):
+                shutil.rmtree(entry.path, ignore_errors=True)
+                logger.debug(f"Removed stale temp directory {entry.path}")
+        except OSError:
+            pass
+
+
+def drain_lines(stream, tail, on_line=None):
+    """Read a text stream to EOF, keeping its last lines in tail (a bounded deque)."""
+    for line in stream:
+        line = line.rstrip()
+        if line:
+            tail.append(line)
+            if on_line is not None:
+                on_line(line)
+
+
+def link_or_symlink(src, dst):
+    """Hard-link dst to src, or symlink it where a hard link is impossible (e.g. across filesystems)."""
+    try:
+        os.link(src, dst)
+    except OSError as e:
+        if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.EOPNOTSUPP):
+            raise
+        os.symlink(Path(src).resolve(), dst)
+
+
+@contextmanager
+def bulk_layout(widget):
+    """Add or move many children of widget with painting and relayout deferred to the end."""
+    layout = widget.layout()
+    widget.setUpdatesEnabled(False)
+    layout.setEnabled(False)
+    try:
+        yield
+    finally:
+        layout.setEnabled(True)
+        layout.activate()  # one layout pass for the whole batch
+        widget.setUpdatesEnabled(True)
+
+
+def cached_thumbnail(file_path):
+    """Get a thumbnail from the in-memory QPixmapCache, or None (GUI thread only)."""
+    return QPixmapCache.find(f"thumb:{file_path}")
+
+
+def cache_thumbnail(file_path, pixmap):
+    """Put a thumbnail into the in-memory QPixmapCache (GUI thread only)."""
+    QPixmapCache.insert(f"thumb:{file_path}", pixmap)
+
+
+class _VideoThumbnailJob(QRunnable):
+    """Load video thumbnails batch by batch on a pool thread until none are pending."""
+
+    def __init__(self, manager, generation):
+        super().__init__()
+        self.load = manager._load_video_thumbnails_background
+        self.generation = generation
+
+    def run(self):
+        self.load(self.generation)
 
 
 class RoundedButton(QPushButton):
@@ -328,14 +815,108 @@ class ClickableSlider(QSlider):
             super().mousePressEvent(event)
 
 
-class DraggableThumbnail(QPushButton):
-    """Thumbnail button that supports drag-and-drop."""
+class _DragMixin:
+    """Press/move/release handling shared by the draggable thumbnail buttons.
 
-    def __init__(self, file_path, pixmap=None, parent=None):
-        super().__init__(parent)
+    Subclasses set the mime format, drag pixmap size and drop actions, and
+    may override _drag_pixmap().
+    """
+
+    MIME_FORMAT = None
+    DRAG_SIZE = 80
+    DRAG_ACTIONS = Qt.MoveAction
+    IDLE_CURSOR = Qt.OpenHandCursor
+    PRESSED_CURSOR = Qt.ClosedHandCursor
+    _DRAG_DIST = None  # QApplication.startDragDistance(), read on first construction
+
+    def _init_drag(self, file_path, pixmap):
         self.file_path = Path(file_path)
+        self._path_str = str(self.file_path)  # mime text and TimelineWidget key
+        self._suffix_lower = self.file_path.suffix.lower()
         self.pixmap = pixmap
         self.drag_start_position = None
+        if _DragMixin._DRAG_DIST is None:
+            _DragMixin._DRAG_DIST = QApplication.startDragDistance()
+
+    def _drag_pixmap(self):
+        """Pixmap shown under the cursor while dragging, or None."""
+        if self.pixmap:
+            return self.pixmap.scaled(self.DRAG_SIZE, self.DRAG_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        return None
+
+    def mousePressEvent(self, event):
+        """Store drag start position."""
+        if event.button() == Qt.LeftButton:
+            self.drag_start_position = event.pos()
+            self.setCursor(self.PRESSED_CURSOR)
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        """Start drag operation if mouse moved far enough."""
+        if not (event.buttons() & Qt.LeftButton):
+            return
+        if self.drag_start_position is None:
+            return
+        if (event.pos() - self.drag_start_position).manhattanLength() < self._DRAG_DIST:
+            return
+
+        # Create drag object carrying the file path
+        drag = QDrag(self)
+        mime_data = QMimeData()
+        mime_data.setText(self._path_str)
+        mime_data.setData(self.MIME_FORMAT, self._path_str.encode())
+        drag.setMimeData(mime_data)
+
+        pixmap = self._drag_pixmap()
+        if pixmap is not None:
+            drag.setPixmap(pixmap)
+        drag.setHotSpot(QPoint(self.DRAG_SIZE // 2, self.DRAG_SIZE // 2))
+
+        # Execute drag; the drop target handles adding or reordering
+        drag.exec_(self.DRAG_ACTIONS)
+        self.setCursor(self.IDLE_CURSOR)
+
+    def mouseReleaseEvent(self, event):
+        """Reset cursor on release."""
+        self.setCursor(self.IDLE_CURSOR)
+        super().mouseReleaseEvent(event)
+
+
+class DraggableThumbnail(_DragMixin, QPushButton):
+    """Thumbnail button that supports drag-and-drop."""
+
+    MIME_FORMAT = "application/x-slideshow-file"
+    DRAG_ACTIONS = Qt.CopyAction | Qt.MoveAction
+
+    # Drag pixmaps for items without a thumbnail, rendered once by drag_placeholder()
+    _IMG_PLACEHOLDER = None
+    _VID_PLACEHOLDER = None
+
+    @classmethod
+    def _ensure_placeholders(cls):
+        if cls._IMG_PLACEHOLDER is not None:
+            return
+        placeholders = []
+        for emoji in ("🖼️", "📹"):
+            pixmap = QPixmap(80, 80)
+            pixmap.fill(QColor("#2a2a2a"))
+            painter = QPainter(pixmap)
+            painter.setPen(QColor("white"))
+            painter.setFont(QFont("Arial", 24))
+            painter.drawText(pixmap.rect(), Qt.AlignCenter, emoji)
+            painter.end()
+            placeholders.append(pixmap)
+        cls._IMG_PLACEHOLDER, cls._VID_PLACEHOLDER = placeholders
+
+    @classmethod
+    def drag_placeholder(cls, file_path):
+        """Get the shared 80x80 drag pixmap for an image or video without a thumbnail."""
+        cls._ensure_placeholders()
+        return cls._VID_PLACEHOLDER if Path(file_path).suffix.lower() in VIDEO_FORMATS else cls._IMG_PLACEHOLDER
+
+    def __init__(self, file_path, pixmap=None, parent=None):
+        super().__init__(parent)
+        self._init_drag(file_path, pixmap)
 
         self.setFixedSize(100, 100)
         self.setCursor(Qt.OpenHandCursor)
@@ -350,7 +931,7 @@ class DraggableThumbnail(QPushButton):
             self._icon = icon  # Store icon reference
         else:
             # Placeholder based on file type
-            if self.file_path.suffix.lower() in VIDEO_FORMATS:
+            if self._suffix_lower in VIDEO_FORMATS:
                 self.setText("📹")
             else:
                 self.setText("🖼️")
@@ -373,71 +954,21 @@ class DraggableThumbnail(QPushButton):
         # Tooltip
         self.setToolTip(f"{self.file_path.name}\n\nDrag to timeline to add")
 
-    def mousePressEvent(self, event):
-        """Store drag start position."""
-        if event.button() == Qt.LeftButton:
-            self.drag_start_position = event.pos()
-            self.setCursor(Qt.ClosedHandCursor)
-        super().mousePressEvent(event)
-
-    def mouseMoveEvent(self, event):
-        """Start drag operation if mouse moved far enough."""
-        if not (event.buttons() & Qt.LeftButton):
-            return
-        if self.drag_start_position is None:
-            return
-        if (event.pos() - self.drag_start_position).manhattanLength() < QApplication.startDragDistance():
-            return
-
-        # Create drag object
-        drag = QDrag(self)
-        mime_data = QMimeData()
-
-        # Store file path in mime data
-        mime_data.setText(str(self.file_path))
-        mime_data.setData("application/x-slideshow-file", str(self.file_path).encode())
-
-        drag.setMimeData(mime_data)
-
-        # Set drag pixmap (thumbnail preview)
-        if self.pixmap:
-            drag.setPixmap(self.pixmap.scaled(80, 80, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-        else:
-            # Create a simple pixmap with text
-            pixmap = QPixmap(80, 80)
-            pixmap.fill(QColor("#2a2a2a"))
-            painter = QPainter(pixmap)
-            painter.setPen(QColor("white"))
-            painter.setFont(QFont("Arial", 24))
-            if self.file_path.suffix.lower() in VIDEO_FORMATS:
-                painter.drawText(pixmap.rect(), Qt.AlignCenter, "📹")
-            else:
-                painter.drawText(pixmap.rect(), Qt.AlignCenter, "🖼️")
-            painter.end()
-            drag.setPixmap(pixmap)
-
-        drag.setHotSpot(QPoint(40, 40))
-
-        # Execute drag
-        drag.exec_(Qt.CopyAction | Qt.MoveAction)
-        self.setCursor(Qt.OpenHandCursor)
-
-    def mouseReleaseEvent(self, event):
-        """Reset cursor on release."""
-        self.setCursor(Qt.OpenHandCursor)
-        super().mouseReleaseEvent(event)
+    def _drag_pixmap(self):
+        pixmap = super()._drag_pixmap()
+        return self.drag_placeholder(self.file_path) if pixmap is None else pixmap
 
 
-class TimelineThumbnail(QPushButton):
+class TimelineThumbnail(_DragMixin, QPushButton):
     """Thumbnail in timeline that can be reordered and removed."""
 
     removed = pyqtSignal(object)  # Signal emitted when thumbnail is removed
+    MIME_FORMAT = "application/x-timeline-reorder"
+    DRAG_SIZE = 60
 
     def __init__(self, file_path, pixmap=None, parent=None):
         super().__init__(parent)
-        self.file_path = Path(file_path)
-        self.pixmap = pixmap
-        self.drag_start_position = None
+        self._init_drag(file_path, pixmap)
 
         self.setFixedSize(80, 80)
         self.setCursor(Qt.OpenHandCursor)
@@ -450,7 +981,7 @@ class TimelineThumbnail(QPushButton):
             self.setIconSize(QSize(70, 70))
             self._icon = icon  # Store icon reference
         else:
-            if self.file_path.suffix.lower() in VIDEO_FORMATS:
+            if self._suffix_lower in VIDEO_FORMATS:
                 self.setText("📹")
             else:
                 self.setText("🖼️")
@@ -486,46 +1017,28 @@ class TimelineThumbnail(QPushButton):
         if action == remove_action:
             self.removed.emit(self)
 
-    def mousePressEvent(self, event):
-        """Store drag start position."""
-        if event.button() == Qt.LeftButton:
-            self.drag_start_position = event.pos()
-            self.setCursor(Qt.ClosedHandCursor)
-        super().mousePressEvent(event)
 
-    def mouseMoveEvent(self, event):
-        """Start drag operation for reordering."""
-        if not (event.buttons() & Qt.LeftButton):
-            return
-        if self.drag_start_position is None:
-            return
-        if (event.pos() - self.drag_start_position).manhattanLength() < QApplication.startDragDistance():
-            return
-
-        # Create drag object
-        drag = QDrag(self)
-        mime_data = QMimeData()
-
-        # Store file path and mark as timeline reorder
-        mime_data.setText(str(self.file_path))
-        mime_data.setData("application/x-timeline-reorder", str(self.file_path).encode())
+class GalleryThumbnail(_DragMixin, QPushButton):
+    """Gallery or video grid button; the window connects clicked and styles it."""
 
-        drag.setMimeData(mime_data)
-
-        # Set drag pixmap
-        if self.pixmap:
-            drag.setPixmap(self.pixmap.scaled(60, 60, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-
-        drag.setHotSpot(QPoint(30, 30))
+    MIME_FORMAT = "application/x-slideshow-file"
+    DRAG_ACTIONS = Qt.CopyAction
+    IDLE_CURSOR = PRESSED_CURSOR = Qt.PointingHandCursor
 
-        # Execute drag - don't remove after, let TimelineWidget handle reordering
-        drag.exec_(Qt.MoveAction)
-        self.setCursor(Qt.OpenHandCursor)
+    def __init__(self, img_path, index=None, parent=None):
+        super().__init__(parent)
+        self._init_drag(img_path, None)
+        self.img_path = img_path
+        self.index = index  # position in SlideshowManager.images (gallery only)
+        self.setCursor(self.IDLE_CURSOR)
 
-    def mouseReleaseEvent(self, event):
-        """Reset cursor on release."""
-        self.setCursor(Qt.OpenHandCursor)
-        super().mouseReleaseEvent(event)
+    def _drag_pixmap(self):
+        if not self.icon().isNull():
+            return self.icon().pixmap(self.DRAG_SIZE, self.DRAG_SIZE)
+        pixmap = cached_thumbnail(self.img_path)
+        if pixmap is not None:
+            return pixmap.scaled(self.DRAG_SIZE, self.DRAG_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        return DraggableThumbnail.drag_placeholder(self.img_path)
 
 
 class TimelineWidget(QFrame):
@@ -533,24 +1046,41 @@ class TimelineWidget(QFrame):
 
     timeline_changed = pyqtSignal(list)  # Signal emitted when timeline changes
 
+    EMPTY_STYLE = """
+        QFrame {
+            background-color: #1a1a1a;
+            border: 2px dashed #3d3d3d;
+            border-radius: 8px;
+        }
+    """
+    FILLED_STYLE = """
+        QFrame {
+            background-color: #1a1a1a;
+            border: 2px solid #00ff00;
+            border-radius: 8px;
+        }
+    """
+    DRAG_OVER_STYLE = """
+        QFrame {
+            background-color: #2a3a2a;
+            border: 2px solid #00ff00;
+            border-radius: 8px;
+        }
+    """
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.timeline_items = []  # List of file paths in order
+        self.timeline_items = []  # List of file paths (str) in order
         self.thumbnail_widgets = []  # List of TimelineThumbnail widgets
+        self._index = {}  # {file path: position in timeline_items}
+        self._frame_style = None  # stylesheet currently applied to the frame
+        self._dirty = False  # a _flush is scheduled
+        self._pending_remove = []  # thumbnails queued by remove_thumbnail
 
         self.setAcceptDrops(True)
         self.setMinimumHeight(100)
         self.setMaximumHeight(150)
 
-        # Styling
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #1a1a1a;
-                border: 2px dashed #3d3d3d;
-                border-radius: 8px;
-            }
-        """)
-
         # Layout
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(5, 5, 5, 5)
@@ -584,35 +1114,31 @@ class TimelineWidget(QFrame):
         """Show/hide empty state label."""
         is_empty = len(self.timeline_items) == 0
         self.empty_label.setVisible(is_empty)
-        if is_empty:
-            self.setStyleSheet("""
-                QFrame {
-                    background-color: #1a1a1a;
-                    border: 2px dashed #3d3d3d;
-                    border-radius: 8px;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QFrame {
-                    background-color: #1a1a1a;
-                    border: 2px solid #00ff00;
-                    border-radius: 8px;
-                }
-            """)
+        self._set_frame_style(self.EMPTY_STYLE if is_empty else self.FILLED_STYLE)
+
+    def _set_frame_style(self, style):
+        """Apply a frame stylesheet, skipping the reparse if it is already applied."""
+        if style is not self._frame_style:
+            self._frame_style = style
+            self.setStyleSheet(style)
+
+    def _schedule_update(self):
+        """Coalesce restyling and timeline_changed for all mutations in this event loop turn."""
+        if not self._dirty:
+            self._dirty = True
+            QTimer.singleShot(0, self._flush)
+
+    def _flush(self):
+        self._dirty = False
+        self.update_empty_state()
+        self.timeline_changed.emit(list(self.timeline_items))
 
     def dragEnterEvent(self, event):
         """Accept drag events with file data."""
         if event.mimeData().hasFormat("application/x-slideshow-file") or \
            event.mimeData().hasFormat("application/x-timeline-reorder"):
             event.acceptProposedAction()
-            self.setStyleSheet("""
-                QFrame {
-                    background-color: #2a3a2a;
-                    border: 2px solid #00ff00;
-                    border-radius: 8px;
-                }
-            """)
+            self._set_frame_style(self.DRAG_OVER_STYLE)
         else:
             event.ignore()
 
@@ -650,13 +1176,15 @@ class TimelineWidget(QFrame):
 
     def add_item(self, file_path, pixmap=None):
         """Add item to timeline."""
-        file_path = Path(file_path)
+        self._flush_removes()
+        file_path = str(file_path)
 
         # Avoid duplicates
-        if str(file_path) in [str(p) for p in self.timeline_items]:
-            logger.debug(f"Item already in timeline: {file_path.name}")
+        if file_path in self._index:
+            logger.debug(f"Item already in timeline: {file_path}")
             return
 
+        self._index[file_path] = len(self.timeline_items)
         self.timeline_items.append(file_path)
 
         # Create thumbnail widget
@@ -667,29 +1195,46 @@ class TimelineWidget(QFrame):
         # Insert before stretch
         self.timeline_layout.insertWidget(len(self.thumbnail_widgets) - 1, thumbnail)
 
-        self.update_empty_state()
-        self.timeline_changed.emit(self.timeline_items)
-        logger.info(f"Added to timeline: {file_path.name}")
+        self._schedule_update()
+        logger.info(f"Added to timeline: {thumbnail.file_path.name}")
 
     def remove_thumbnail(self, thumbnail):
-        """Remove thumbnail from timeline."""
-        if thumbnail in self.thumbnail_widgets:
-            index = self.thumbnail_widgets.index(thumbnail)
-            self.thumbnail_widgets.remove(thumbnail)
-            self.timeline_items.pop(index)
-            thumbnail.deleteLater()
-            self.update_empty_state()
-            self.timeline_changed.emit(self.timeline_items)
-            logger.info(f"Removed from timeline: {thumbnail.file_path.name}")
+        """Queue a thumbnail for removal; removals in one event loop turn are applied together."""
+        if not self._pending_remove:
+            QTimer.singleShot(0, self._flush_removes)
+        self._pending_remove.append(thumbnail)
+
+    def _flush_removes(self):
+        """Apply queued removals in one pass over the timeline."""
+        if not self._pending_remove:
+            return
+        doomed = set(self._pending_remove)
+        self._pending_remove.clear()
+        keep = [widget for widget in self.thumbnail_widgets if widget not in doomed]
+        if len(keep) == len(self.thumbnail_widgets):
+            return
+
+        self.timeline_container.setUpdatesEnabled(False)
+        for widget in self.thumbnail_widgets:
+            if widget in doomed:
+                self.timeline_layout.removeWidget(widget)
+                widget.deleteLater()
+                logger.info(f"Removed from timeline: {widget.file_path.name}")
+        self.thumbnail_widgets[:] = keep
+        self.timeline_items[:] = [widget._path_str for widget in keep]
+        self._index.clear()
+        self._reindex(0)
+        self.timeline_container.setUpdatesEnabled(True)
+        self._schedule_update()
 
     def reorder_item(self, file_path, new_index):
         """Reorder item in timeline."""
-        file_path = Path(file_path)
+        self._flush_removes()
+        file_path = str(file_path)
 
         # Find current index
-        try:
-            old_index = [str(p) for p in self.timeline_items].index(str(file_path))
-        except ValueError:
+        old_index = self._index.get(file_path)
+        if old_index is None:
             logger.warning(f"Item not found in timeline: {file_path}")
             return
 
@@ -712,39 +1257,170 @@ class TimelineWidget(QFrame):
         self.timeline_items.insert(new_index, file_path)
         self.thumbnail_widgets.insert(new_index, old_widget)
         self.timeline_layout.insertWidget(new_index, old_widget)
+        self._reindex(min(old_index, new_index), max(old_index, new_index) + 1)
+
+        self._schedule_update()
+        logger.info(f"Reordered in timeline: {old_widget.file_path.name} from position {old_index} to {new_index}")
 
-        self.timeline_changed.emit(self.timeline_items)
-        logger.info(f"Reordered in timeline: {file_path.name} from position {old_index} to {new_index}")
+    def _reindex(self, start, stop=None):
+        """Refresh _index for the items in timeline_items[start:stop] after they moved."""
+        for i in range(start, len(self.timeline_items) if stop is None else stop):
+            self._index[self.timeline_items[i]] = i
 
     def clear(self):
         """Clear all items from timeline."""
+        self._pending_remove.clear()
         for widget in self.thumbnail_widgets:
+            self.timeline_layout.removeWidget(widget)
             widget.deleteLater()
         self.thumbnail_widgets.clear()
         self.timeline_items.clear()
-        self.update_empty_state()
-        self.timeline_changed.emit(self.timeline_items)
+        self._index.clear()
+        self._schedule_update()
         logger.info("Timeline cleared")
 
-    def set_items(self, file_paths, thumbnail_cache=None):
+    def set_items(self, file_paths):
         """Set timeline items from list of file paths."""
         self.clear()
-        for file_path in file_paths:
-            pixmap = None
-            if thumbnail_cache and Path(file_path) in thumbnail_cache:
-                pixmap = thumbnail_cache[Path(file_path)]
-            self.add_item(file_path, pixmap)
+        # Take the trailing stretch out so each insert is a plain append, and hold
+        # repaints until the whole batch is in; timeline_changed fires once via _flush
+        self.timeline_container.setUpdatesEnabled(False)
+        stretch = self.timeline_layout.takeAt(self.timeline_layout.count() - 1)
+        try:
+            for file_path in file_paths:
+                self.add_item(file_path, cached_thumbnail(file_path))
+        finally:
+            self.timeline_layout.addItem(stretch)
+            self.timeline_container.setUpdatesEnabled(True)
+
+
+class FFmpegWorker(QObject):
+    """Run export jobs one after another in a QProcess, driven by the Qt event loop (no threads)."""
+
+    finished = pyqtSignal(str, bool)  # (output file, success)
+    progress_changed = pyqtSignal(str, float)  # (output file, seconds of output written)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.jobs = deque()  # (program, args, stdin data, output_file) waiting to run
+        self.current = None
+        self._stdout_tail = b""  # incomplete -progress line from the last read
+        self._stderr_partial = b""  # incomplete stderr line from the last read
+        self._stderr_tail = deque(maxlen=STDERR_TAIL_LINES)  # last stderr lines, for the failure log
+        self.process = QProcess(self)
+        self.process.setWorkingDirectory(str(OUTPUT_DIR))
+        self.process.readyReadStandardOutput.connect(self._on_stdout)
+        # Drained as it arrives so a verbose encode doesn't pile up inside QProcess
+        self.process.readyReadStandardError.connect(self._on_stderr)
+        self.process.finished.connect(self._on_finished)
+        self.process.errorOccurred.connect(self._on_error)
+
+    def concat(self, video_paths, output_file):
+        """Queue a concatenation of video_paths into output_file (relative to OUTPUT_DIR)."""
+        # Entries need an explicit file: URL, or ffmpeg resolves them relative to pipe:
+        manifest = "".join(
+            "file 'file:{}'\n".format(os.path.abspath(p).replace("'", "'\\''")) for p in video_paths
+        )
+        self._queue('ffmpeg', [
+            '-hide_banner', '-y', '-loglevel', 'error', '-nostats', '-progress', 'pipe:1',
+            '-f', 'concat', '-safe', '0', '-protocol_whitelist', 'file,pipe,fd',
+            '-i', 'pipe:0', '-c', 'copy', output_file
+        ], manifest.encode(), output_file)
+
+    def run(self, argv, output_file):
+        """Queue an ffmpeg argv that writes output_file (relative to OUTPUT_DIR)."""
+        self._queue(argv[0], ['-nostats', '-progress', 'pipe:1'] + argv[1:], None, output_file)
+
+    def run_script(self, command, output_file):
+        """Queue a shell script that writes output_file (relative to OUTPUT_DIR)."""
+        self._queue('sh', ['-c', command], None, output_file)
+
+    def _queue(self, program, args, stdin_data, output_file):
+        self.jobs.append((program, args, stdin_data, output_file))
+        if self.current is None:
+            self._start_next()
+
+    def _start_next(self):
+        if not self.jobs:
+            self.current = None
+            return
+        self.current = program, args, stdin_data, output_file = self.jobs.popleft()
+        self._stdout_tail = self._stderr_partial = b""
+        self._stderr_tail.clear()
+        argv = low_priority([program] + args)
+        self.process.start(argv[0], argv[1:])
+        if stdin_data is not None:
+            self.process.write(stdin_data)
+        self.process.closeWriteChannel()
+
+    def _on_stdout(self):
+        """Parse ffmpeg's -progress key=value blocks as they arrive."""
+        lines = (self._stdout_tail + bytes(self.process.readAllStandardOutput())).split(b"\n")
+        self._stdout_tail = lines.pop()
+        for line in lines:
+            # out_time_ms is in microseconds as well, despite its name
+            if line.startswith(b"out_time_us="):
+                try:
+                    seconds = int(line[12:]) / 1_000_000
+                except ValueError:  # "N/A" before the first packet
+                    continue
+                self.progress_changed.emit(self.current[3], seconds)
+
+    def _on_stderr(self):
+        lines = (self._stderr_partial + bytes(self.process.readAllStandardError())).split(b"\n")
+        self._stderr_partial = lines.pop()
+        for line in lines:
+            line = line.decode(errors='replace').rstrip()
+            logger.debug(f"ffmpeg: {line}")
+            self._stderr_tail.append(line)
+
+    def _on_finished(self, exit_code, exit_status):
+        output_file = self.current[3]
+        if exit_status == QProcess.NormalExit and exit_code == 0:
+            logger.info(f"ffmpeg job finished: {output_file}")
+            self.finished.emit(output_file, True)
+        else:
+            self._on_stderr()
+            if self._stderr_partial:
+                self._stderr_tail.append(self._stderr_partial.decode(errors='replace'))
+            stderr = "\n".join(self._stderr_tail)
+            logger.error(f"ffmpeg job failed: {output_file}: {stderr}")
+            self.finished.emit(output_file, False)
+        QTimer.singleShot(0, self._start_next)
+
+    def _on_error(self, error):
+        # A process that never started won't emit finished
+        if error == QProcess.FailedToStart and self.current is not None:
+            logger.error(f"Could not start ffmpeg job for {self.current[3]}: {self.process.errorString()}")
+            self.finished.emit(self.current[3], False)
+            # Start the next job once QProcess has finished reporting this one
+            QTimer.singleShot(0, self._start_next)
 
 
 class PlaylistExportDialog(QDialog):
     """Dialog for exporting playlist as FFmpeg concatenation script."""
 
-    def __init__(self, playlist, db, parent=None):
+    streams_probed = pyqtSignal(object, object)  # (misses, probe_streams_many() result)
+
+    def __init__(self, playlist, db, parent=None, ffmpeg_worker=None, hw_encoder=None, executor=None):
         super().__init__(parent)
         self.playlist = playlist
         self.db = db
+        self.ffmpeg_worker = ffmpeg_worker
+        self.executor = executor  # runs exports when there is no ffmpeg_worker
+        self.hw_encoder = hw_encoder  # detect_hw_encoder() result, offered for re-encoding
+        self._preview_cache = {}  # {(method, output_file, encoder): rendered script}
+        self._compatible = None  # whether all videos share stream parameters; None until probed
+        self._saved_script = None  # get_script() row last loaded into the preview
         self.setWindowTitle("Export Playlist as FFmpeg Script")
         self.setGeometry(200, 200, 800, 600)
+        self.streams_probed.connect(self._on_streams_probed)
+        self._probed, misses = db.cached_probes(playlist)
+        if misses:
+            # ffprobe can take seconds per video; until it answers, re-encode methods re-encode
+            self._run_in_background(self._probe_streams, misses)
+        else:
+            self._compatible = self._signatures_match(self._probed)
         self.setup_ui()
 
     def setup_ui(self):
@@ -797,6 +1473,13 @@ class PlaylistExportDialog(QDialog):
         method_layout.addWidget(self.method_combo)
         layout.addLayout(method_layout)
 
+        # Hardware encoding (re-encode methods only)
+        self.hw_checkbox = QCheckBox(f"Use hardware encoder ({self.hw_encoder})")
+        self.hw_checkbox.setChecked(self.hw_encoder is not None)
+        self.hw_checkbox.setVisible(self.hw_encoder is not None)
+        self.hw_checkbox.toggled.connect(self.update_preview)
+        layout.addWidget(self.hw_checkbox)
+
         # FFmpeg command preview
         preview_label = QLabel("FFmpeg Command Preview:")
         preview_label.setFont(QFont("Arial", 10, QFont.Bold))
@@ -870,7 +1553,11 @@ class PlaylistExportDialog(QDialog):
         script_data = self.db.get_script(name)
 
         if script_data:
+            self._saved_script = script_data
             self.command_preview.setPlainText(script_data['command'])
+            if script_data['argv']:
+                # Its stored argv writes the output it was saved with
+                self.output_input.setText(script_data['argv'][-1])
             self.name_input.setText(script_data['name'])
             self.desc_input.setText(script_data['description'])
 
@@ -878,22 +1565,80 @@ class PlaylistExportDialog(QDialog):
         """Update the FFmpeg command preview."""
         method = self.method_combo.currentIndex()
         output_file = self.output_input.text()
+        self.command_preview.setPlainText(self.render_script(method, output_file))
+
+    def render_script(self, method, output_file):
+        """Return the script for a method, rendering it once per (method, output_file, encoder)."""
+        key = (method, output_file, self._encoder())
+        command = self._preview_cache.get(key)
+        if command is None:
+            if method == 0:  # concat demuxer
+                command = self.generate_concat_demuxer_script(output_file)
+            elif self._streams_compatible():
+                # Re-encoding would only reproduce what the inputs already share
+                command = ("# All videos share codec, resolution and timebase: stream copy instead of re-encoding\n"
+                           + self.generate_concat_demuxer_script(output_file))
+            elif method == 1:  # concat filter
+                command = self.generate_concat_filter_script(output_file)
+            else:  # concat protocol
+                command = self.generate_concat_protocol_script(output_file)
+            self._preview_cache[key] = command
+        return command
+
+    def _streams_compatible(self):
+        """Check whether every playlist video has the same stream parameters (False while still probing)."""
+        return bool(self._compatible)
+
+    def _signatures_match(self, probed):
+        signatures = set()
+        for video_path in self.playlist:
+            streams = probed.get(video_path)
+            if not streams:
+                compatible = False
+                break
+            signatures.add(tuple(tuple(sorted(stream.items())) for stream in streams))
+        else:
+            compatible = len(signatures) == 1
+        logger.info(f"Playlist streams compatible for stream copy: {compatible}")
+        return compatible
 
-        if method == 0:  # concat demuxer
-            command = self.generate_concat_demuxer_script(output_file)
-        elif method == 1:  # concat filter
-            command = self.generate_concat_filter_script(output_file)
-        else:  # concat protocol
-            command = self.generate_concat_protocol_script(output_file)
+    def _probe_streams(self, misses):
+        """Worker: probe the videos missing from the probe cache."""
+        probed = probe_streams_many(list(misses))
+        try:
+            self.streams_probed.emit(misses, probed)
+        except RuntimeError:  # dialog already closed and deleted
+            pass
 
-        self.command_preview.setPlainText(command)
+    def _on_streams_probed(self, misses, probed):
+        self.db.save_probes(misses, probed)
+        self._probed.update(probed)
+        method, output_file = self.method_combo.currentIndex(), self.output_input.text()
+        unedited = self.command_preview.toPlainText() == self.render_script(method, output_file)
+        self._compatible = self._signatures_match(self._probed)
+        self._preview_cache.clear()
+        if unedited:
+            self.update_preview()
+
+    def _uses_stream_copy(self, method):
+        return method == 0 or self._streams_compatible()
+
+    def command_argv(self, command, method, output_file):
+        """Get the argv an unedited re-encoding command runs, or None if it needs a shell."""
+        if not self._uses_stream_copy(method) and command == self.render_script(method, output_file):
+            if method == 1:
+                return self.generate_concat_filter_argv(output_file)
+            return self.generate_concat_protocol_argv(output_file)
+        if self._saved_script and command == self._saved_script['command']:
+            return self._saved_script['argv']
+        return None
 
     def generate_concat_demuxer_script(self, output_file):
         """Generate FFmpeg concat demuxer script (fast, no re-encode)."""
         # Create file list
-        file_list = "# FFmpeg concat demuxer file list\n"
-        for video_path in self.playlist:
-            file_list += f"file '{video_path}'\n"
+        file_list = "# FFmpeg concat demuxer file list\n" + "".join(
+            f"file '{video_path}'\n" for video_path in self.playlist
+        )
 
         command = f"""# Step 1: Create concat.txt file with video list
 cat > concat.txt << 'EOF'
@@ -907,38 +1652,60 @@ rm concat.txt
 """
         return command
 
+    def _encoder(self):
+        """Get the hardware encoder to re-encode with, or None for libx264."""
+        return self.hw_encoder if self.hw_checkbox.isChecked() else None
+
+    def _concat_filter_args(self, output_file):
+        """Concat filter argv, grouped the way the script lays it out."""
+        global_args, input_args, video_args, video_filter = HW_ENCODERS.get(self._encoder(), _SOFTWARE_ENCODER)
+        inputs = ['ffmpeg', *global_args,
+                  *(arg for video_path in self.playlist for arg in (*input_args, '-i', str(video_path)))]
+        filter_complex = "".join(
+            f"[{i}:v:0][{i}:a:0]" for i in range(len(self.playlist))
+        ) + f"concat=n={len(self.playlist)}:v=1:a=1"
+        if video_filter:
+            filter_complex += f"[concatv][outa];[concatv]{video_filter}[outv]"
+        else:
+            filter_complex += "[outv][outa]"
+        return [
+            inputs,
+            ['-filter_complex', filter_complex],
+            ['-map', '[outv]', '-map', '[outa]'],
+            video_args,
+            ['-c:a', 'aac', '-b:a', '192k'],
+            [output_file],
+        ]
+
+    def _concat_protocol_args(self, output_file):
+        """Concat protocol argv, grouped the way the script lays it out."""
+        global_args, input_args, video_args, video_filter = HW_ENCODERS.get(self._encoder(), _SOFTWARE_ENCODER)
+        concat_str = "concat:" + "|".join(map(str, self.playlist))
+        return [
+            ['ffmpeg', *global_args, *input_args, '-i', concat_str],
+            *([['-vf', video_filter]] if video_filter else []),
+            video_args,
+            ['-c:a', 'aac', '-b:a', '192k'],
+            [output_file],
+        ]
+
+    def generate_concat_filter_argv(self, output_file):
+        """Generate the FFmpeg concat filter argv (re-encode, more compatible)."""
+        return [arg for group in self._concat_filter_args(output_file) for arg in group]
+
     def generate_concat_filter_script(self, output_file):
         """Generate FFmpeg concat filter script (re-encode, more compatible)."""
-        inputs = ""
-        filter_complex = ""
-
-        for i, video_path in enumerate(self.playlist):
-            inputs += f"-i '{video_path}' "
-            filter_complex += f"[{i}:v:0][{i}:a:0]"
-
-        filter_complex += f"concat=n={len(self.playlist)}:v=1:a=1[outv][outa]"
-
-        command = f"""# FFmpeg concat filter (re-encode for compatibility)
-ffmpeg {inputs}\\
-  -filter_complex "{filter_complex}" \\
-  -map "[outv]" -map "[outa]" \\
-  -c:v libx264 -preset medium -crf 23 \\
-  -c:a aac -b:a 192k \\
-  {output_file}
-"""
-        return command
+        return ("# FFmpeg concat filter (re-encode for compatibility)\n"
+                + shell_command(*self._concat_filter_args(output_file)) + "\n")
+
+    def generate_concat_protocol_argv(self, output_file):
+        """Generate the FFmpeg concat protocol argv (simple, re-encode)."""
+        return [arg for group in self._concat_protocol_args(output_file) for arg in group]
 
     def generate_concat_protocol_script(self, output_file):
         """Generate FFmpeg concat protocol script (simple, re-encode)."""
-        concat_str = "concat:" + "|".join(self.playlist)
-
-        command = f"""# FFmpeg concat protocol (simple, re-encode)
-ffmpeg -i "{concat_str}" \\
-  -c:v libx264 -preset medium -crf 23 \\
-  -c:a aac -b:a 192k \\
-  {output_file}
-"""
-        return command
+        return ("# FFmpeg concat protocol (simple, re-encode)\n"
+                + shell_command(*self._concat_protocol_args(output_file)) + "\n")
 
     def save_script(self):
         """Save the script to database."""
@@ -949,8 +1716,9 @@ ffmpeg -i "{concat_str}" \\
 
         description = self.desc_input.text().strip()
         command = self.command_preview.toPlainText()
+        argv = self.command_argv(command, self.method_combo.currentIndex(), self.output_input.text())
 
-        self.db.save_script(name, command, description)
+        self.db.save_script(name, command, description, argv)
         QMessageBox.information(self, "Success", f"Script '{name}' saved to database!")
         self.load_saved_scripts()
 
@@ -978,7 +1746,7 @@ ffmpeg -i "{concat_str}" \\
         # Estimate duration
         method = self.method_combo.currentIndex()
         video_count = len(self.playlist)
-        if method == 0:  # concat demuxer
+        if self._uses_stream_copy(method):  # concat demuxer
             estimated_time = "1-2 seconds"
         else:  # re-encode methods
             estimated_time = f"{video_count * 30}-{video_count * 60} seconds"
@@ -993,13 +1761,35 @@ ffmpeg -i "{concat_str}" \\
         if reply == QMessageBox.Yes:
             # Save script to database
             name = self.name_input.text().strip()
+            argv = self.command_argv(command, method, output_file)
             if name:
-                self.db.save_script(name, command, self.desc_input.text())
-                self.db.increment_usage(name)
-
-            # Run in background thread
-            thread = threading.Thread(target=self._run_concat_worker, args=(command, output_file), daemon=True)
-            thread.start()
+                with self.db.transaction():
+                    self.db.save_script(name, command, self.desc_input.text(), argv)
+                    self.db.increment_usage(name)
+
+            # Run in background; unedited commands are run directly instead of
+            # being re-parsed by a shell
+            if self._uses_stream_copy(method) and command == self.render_script(method, output_file):
+                if self.ffmpeg_worker is not None:
+                    self.ffmpeg_worker.concat(self.playlist, output_file)
+                else:
+                    self._run_in_background(self.run_concat_demuxer, output_file)
+            elif argv:
+                if argv[-1] == output_file:
+                    # Overwriting was confirmed above, so ffmpeg must not stop to ask
+                    argv = argv[:1] + ['-y'] + argv[1:]
+                else:
+                    # A saved argv still writes its own output, which nobody confirmed overwriting
+                    output_file = argv[-1]
+                    argv = argv[:1] + ['-n'] + argv[1:]
+                if self.ffmpeg_worker is not None:
+                    self.ffmpeg_worker.run(argv, output_file)
+                else:
+                    self._run_in_background(self._run_concat_worker, argv, output_file)
+            elif self.ffmpeg_worker is not None:
+                self.ffmpeg_worker.run_script(command, output_file)
+            else:
+                self._run_in_background(self._run_concat_worker, ["sh", "-c", command], output_file)
 
             QMessageBox.information(
                 self, "Running",
@@ -1007,23 +1797,60 @@ ffmpeg -i "{concat_str}" \\
             )
             self.accept()
 
-    def _run_concat_worker(self, command, output_file):
-        """Worker thread to run FFmpeg concatenation."""
+    def _run_in_background(self, fn, *args):
+        """Run fn on the shared executor, or on a daemon thread if the dialog has none."""
+        if self.executor is not None:
+            self.executor.submit(fn, *args)
+        else:
+            threading.Thread(target=fn, args=args, daemon=True).start()
+
+    def run_concat_demuxer(self, output_file):
+        """Concatenate the playlist with the concat demuxer, without going through a shell."""
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as tmp:
+            for video_path in self.playlist:
+                # Concat list syntax: a quote inside a quoted path is written as '\''
+                escaped = str(video_path).replace("'", "'\\''")
+                tmp.write(f"file '{escaped}'\n")
         try:
-            # Execute the script
-            result = subprocess.run(
-                command,
-                shell=True,
+            subprocess.run(
+                low_priority(["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+                              "-i", tmp.name, "-c", "copy", output_file]),
                 capture_output=True,
                 text=True,
                 timeout=600,
-                cwd=str(OUTPUT_DIR)
+                cwd=str(OUTPUT_DIR),
+                check=True,
+                creationflags=_LOW_PRIORITY_FLAGS
+            )
+            logger.info(f"Concatenation successful: {output_file}")
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Concatenation failed: {e.stderr}")
+        except Exception as e:
+            logger.error(f"Error running concatenation: {e}")
+        finally:
+            os.unlink(tmp.name)
+
+    def _run_concat_worker(self, argv, output_file):
+        """Worker thread to run FFmpeg concatenation."""
+        try:
+            # Execute the command; only stderr is kept, and it is read as it is written
+            process = subprocess.Popen(
+                low_priority(argv),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                cwd=str(OUTPUT_DIR),
+                creationflags=_LOW_PRIORITY_FLAGS
             )
+            stderr_tail = deque(maxlen=20)
+            for line in process.stderr:
+                logger.debug(f"ffmpeg: {line.rstrip()}")
+                stderr_tail.append(line)
 
-            if result.returncode == 0:
+            if process.wait() == 0:
                 logger.info(f"Concatenation successful: {output_file}")
             else:
-                logger.error(f"Concatenation failed: {result.stderr}")
+                logger.error(f"Concatenation failed: {''.join(stderr_tail)}")
         except Exception as e:
             logger.error(f"Error running concatenation: {e}")
 
@@ -1050,6 +1877,10 @@ ffmpeg -i "{concat_str}" \\
 class SlideshowManager(QMainWindow):
     """Main application window."""
 
+    # (index, path, WebP bytes or None) from the thumbnail process pool
+    thumbnail_data_ready = pyqtSignal(int, object, object)
+    database_ready = pyqtSignal(object)  # FFmpegScriptDatabase opened on a pool thread
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Slideshow Manager")
@@ -1058,37 +1889,80 @@ class SlideshowManager(QMainWindow):
 
         # Data
         self.images = []
+        self.video_paths = frozenset()  # the videos among self.images
+        self.image_stats = {}  # {path: os.stat_result} taken when self.images was loaded
+        self.images_bytes = 0  # total size of self.images
         self.hidden_images = set()
         self.available_videos = []
+        self._videos_dir_mtime = None  # OUTPUT_DIR's mtime when video_combo was last filled
         self.video_players = []
         self.config = {}
+        # set_config() restarts the timer; the write happens on a pool thread
+        self._config_timer = QTimer(self)
+        self._config_timer.setSingleShot(True)
+        self._config_timer.setInterval(CONFIG_SAVE_DELAY_MS)
+        self._config_timer.timeout.connect(self._flush_config)
+        self._config_lock = threading.Lock()
+        self._config_version = 0  # bumped per flush, so a stale write never lands last
+        self._config_written = 0
         self.log_events = []
         self.selected_images = set()
         self.previous_selected_images = set()
         self.select_all_state = 0  # 0=normal, 1=all selected, 2=none selected
 
-        # Performance optimization: thumbnail cache
-        self.thumbnail_cache = {}  # {path: QPixmap}
-        self.video_frame_cache = {}  # {path: frame_path}
-        self.thumbnail_buttons = {}  # {index: button}
-        self.thumbnail_loader_thread = None
-        self.stop_loading = False
+        # Performance optimization: thumbnails are kept in QPixmapCache (see cached_thumbnail)
+        QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT_KB)
+        self.video_frame_cache = OrderedDict()  # {path: frame_path}, see _cached_frame
+        self._frame_cache_lock = threading.Lock()
+        self.thumb_disk_cache = ThumbnailCache()
+        self.thumb_disk_cache.prune()
+        self.frame_disk_cache = ThumbnailCache(FRAME_CACHE_DIR, size=None, suffix=".png")
+        self.frame_disk_cache.prune(FRAME_CACHE_MAX_BYTES)
+        self.thumb_executor = None  # ProcessPoolExecutor, started on the first cache miss
+        # Reused threads for slideshow creation and export fallbacks
+        self.executor = ThreadPoolExecutor(max_workers=BACKGROUND_WORKERS, thread_name_prefix="slideshow")
+        self.executor.submit(remove_stale_temp_dirs)
+        self.thumbnail_data_ready.connect(self._on_thumbnail_data)
+        self.thumbnail_buttons = {}  # {path: button}
+        # Video thumbnails still to load: the viewport's are pushed onto _thumb_queue
+        # (LIFO, so the latest scroll position wins), the rest wait in _thumb_backlog
+        self._thumb_lock = threading.Lock()
+        self._thumb_pending = {}  # {index: path}
+        self._thumb_queue = queue.LifoQueue()
+        self._thumb_backlog = deque()
+        self._thumb_generation = 0  # bumped by update_thumbnails to retire the old loader
+        # Video thumbnail batches run on their own bounded pool; results come back
+        # through thumbnail_data_ready (a queued connection to the GUI thread)
+        self.thumb_pool = QThreadPool(self)
+        self.thumb_pool.setMaxThreadCount(VIDEO_THUMBNAIL_WORKERS)
+        self.stop_loading = False  # plain bool: set on the GUI thread, only read by workers
 
         # Default FFmpeg command (uses image2 demuxer with numbered files)
         # Includes padding to handle odd dimensions and scaling to 1920x1080
         self.default_ffmpeg_cmd = (
             "ffmpeg -y -loglevel error -framerate 1/5 "
             "-i %04d.png "
-            "-vf \"format=yuv420p,scale='min(1920,iw*min(1920/iw\\,1080/ih))':'min(1080,ih*min(1920/iw\\,1080/ih))':force_original_aspect_ratio=decrease,pad=1920:1080:(1920-iw)/2:(1080-ih)/2\" "
+            "-vf \"format=yuv420p,scale='min(1920,iw*min(1920/iw\\,1080/ih))':'min(1080,ih*min(1920/iw\\,1080/ih))':force_original_aspect_ratio=decrease:flags=bilinear,pad=1920:1080:(1920-iw)/2:(1080-ih)/2\" "
             "-c:v libx264 -r 30 -pix_fmt yuv420p -y output.mp4"
         )
 
-        # Initialize database for scripts and playlists
-        self.db = FFmpegScriptDatabase()
+        # Open the scripts/playlists database off the UI thread; the buttons that
+        # need it stay disabled until _on_database_ready
+        self.db = None
+        self.database_ready.connect(self._on_database_ready)
+        QThreadPool.globalInstance().start(self._open_database)
+        # Probed once in the background; the export dialog offers it when found
+        self.hw_encoder = None
+        QThreadPool.globalInstance().start(self._detect_hw_encoder)
+        # Outlives the export dialog so queued exports keep running after it closes
+        self.ffmpeg_worker = FFmpegWorker(self)
+        self.ffmpeg_worker.progress_changed.connect(self._on_export_progress)
+        self.ffmpeg_worker.finished.connect(self._on_export_finished)
 
         # Playlist management
         self.current_playlist = []  # List of video paths in order
-        self.selected_videos_for_playlist = set()  # Set of video paths selected for playlist
+        self.selected_videos_for_playlist = set()  # Set of video Paths selected for playlist
+        self.video_grid_buttons = {}  # {path: button} currently in the video grid
 
         # Load configuration
         self.load_config()
@@ -1104,6 +1978,23 @@ class SlideshowManager(QMainWindow):
 
         logger.info("Slideshow Manager started")
     
+    def _open_database(self):
+        """Open the scripts/playlists database (runs on a QThreadPool thread)."""
+        try:
+            self.database_ready.emit(FFmpegScriptDatabase())
+        except Exception as e:
+            logger.error(f"Error opening database: {e}", exc_info=True)
+
+    def _detect_hw_encoder(self):
+        """Look for a usable hardware H.264 encoder (runs on a QThreadPool thread)."""
+        self.hw_encoder = detect_hw_encoder()
+
+    def _on_database_ready(self, db):
+        """Enable the database-backed controls once the database is open."""
+        self.db = db
+        for btn in (self.btn_export_timeline, self.btn_save_playlist, self.btn_load_playlist):
+            btn.setEnabled(True)
+
     def setup_ui(self):
         """Setup the main UI."""
         central_widget = QWidget()
@@ -1218,9 +2109,9 @@ class SlideshowManager(QMainWindow):
 
         top_layout.addLayout(header_layout)
 
-        # VLC player widget - FIXED: Use media_player_new() instead of media_list_player_new()
-        self.vlc_instance = vlc.Instance()
-        self.media_player = self.vlc_instance.media_player_new()
+        # VLC player is created on first use (see media_player)
+        self._vlc_instance = None
+        self._media_player = None
 
         # Create a stacked widget to hold both VLC player and video thumbnail grid
         from PyQt5.QtWidgets import QStackedWidget
@@ -1230,15 +2121,9 @@ class SlideshowManager(QMainWindow):
         self.vlc_widget = QWidget()
         self.vlc_widget.setStyleSheet("background-color: #1a1a1a; border-radius: 4px;")
         self.vlc_widget.setMinimumSize(400, 225)  # Smaller minimum size for better resizing
-
-        # CRITICAL FIX: Attach VLC to the widget's window handle
-        # This is platform-specific and required for embedded playback
-        if sys.platform.startswith('linux'):  # Linux using X Server
-            self.media_player.set_xwindow(int(self.vlc_widget.winId()))
-        elif sys.platform == "win32":  # Windows
-            self.media_player.set_hwnd(int(self.vlc_widget.winId()))
-        elif sys.platform == "darwin":  # macOS
-            self.media_player.set_nsobject(int(self.vlc_widget.winId()))
+        # winId() for VLC would otherwise turn every ancestor up to the main window
+        # into a native window as well (siblings: see main())
+        self.vlc_widget.setAttribute(Qt.WA_DontCreateNativeAncestors)
 
         self.player_stack.addWidget(self.vlc_widget)
 
@@ -1475,7 +2360,9 @@ class SlideshowManager(QMainWindow):
         btn_export = RoundedButton("📤 Export")
         btn_export.setToolTip("Export timeline as FFmpeg script")
         btn_export.clicked.connect(self.export_timeline_ffmpeg)
+        btn_export.setEnabled(self.db is not None)
         timeline_group.addWidget(btn_export)
+        self.btn_export_timeline = btn_export
 
         btn_clear = RoundedButton("🗑️ Clear")
         btn_clear.setToolTip("Clear all timeline items")
@@ -1562,11 +2449,15 @@ class SlideshowManager(QMainWindow):
 
         btn_save = RoundedButton("💾 Save")
         btn_save.clicked.connect(self.save_playlist_dialog)
+        btn_save.setEnabled(self.db is not None)
         playlist_btn_layout.addWidget(btn_save)
+        self.btn_save_playlist = btn_save
 
         btn_load = RoundedButton("📂 Load")
         btn_load.clicked.connect(self.load_playlist_dialog)
+        btn_load.setEnabled(self.db is not None)
         playlist_btn_layout.addWidget(btn_load)
+        self.btn_load_playlist = btn_load
 
         bottom_layout.addLayout(playlist_btn_layout)
 
@@ -1646,6 +2537,8 @@ class SlideshowManager(QMainWindow):
 
         scroll.setWidget(self.thumbnails_widget)
         layout.addWidget(scroll)
+        self.thumbnails_scroll = scroll
+        scroll.verticalScrollBar().valueChanged.connect(self._enqueue_visible_thumbs)
 
         panel.setLayout(layout)
         return panel
@@ -1691,14 +2584,40 @@ class SlideshowManager(QMainWindow):
             logger.error(f"Error loading config: {e}")
             self.config = {}
     
+    def set_config(self, key, value):
+        """Change a config value; the file is written once changes settle."""
+        self.config[key] = value
+        self._config_timer.start()
+
+    def _flush_config(self):
+        """Write a snapshot of the config on a QThreadPool thread."""
+        self._config_version += 1
+        version, data = self._config_version, json.dumps(self.config, indent=2)
+        QThreadPool.globalInstance().start(lambda: self._write_config(version, data))
+
     def save_config(self):
-        """Save configuration to file."""
-        try:
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(self.config, f, indent=2)
-            logger.info("Configuration saved")
-        except Exception as e:
-            logger.error(f"Error saving config: {e}")
+        """Save configuration to file now, dropping any pending delayed save."""
+        self._config_timer.stop()
+        self._config_version += 1
+        self._write_config(self._config_version, json.dumps(self.config, indent=2))
+
+    def _write_config(self, version, data):
+        """Atomically replace CONFIG_FILE with data, unless a newer version was already written."""
+        tmp_path = None
+        with self._config_lock:
+            if version <= self._config_written:
+                return
+            try:
+                fd, tmp_path = tempfile.mkstemp(suffix='.json', dir=CONFIG_FILE.parent)
+                with os.fdopen(fd, 'w') as f:
+                    f.write(data)
+                os.replace(tmp_path, CONFIG_FILE)
+                self._config_written = version
+                logger.info("Configuration saved")
+            except Exception as e:
+                logger.error(f"Error saving config: {e}")
+                if tmp_path and os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
     
     def detect_video_players(self):
         """Detect available video players."""
@@ -1707,11 +2626,19 @@ class SlideshowManager(QMainWindow):
         logger.info(f"Available players: {self.video_players}")
 
     def extract_video_first_frame(self, video_path):
-        """Extract first frame from video file using FFmpeg (optimized for speed)."""
+        """Extract first frame from video file using FFmpeg (optimized for speed, cached on disk)."""
+        tmp_path = None
         try:
-            # Create temporary PNG file for the frame
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                tmp_path = tmp.name
+            # Frames extracted in an earlier run are reused until the video changes
+            frame_path = self.frame_disk_cache.path_for(video_path)
+            if frame_path.exists():
+                self.frame_disk_cache.mark_used(frame_path)
+                return str(frame_path)
+
+            # ffmpeg writes a temporary file that is renamed into place once complete
+            FRAME_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(suffix='.png', dir=FRAME_CACHE_DIR)
+            os.close(fd)
 
             # Use FFmpeg to extract first frame - optimized for speed
             # -ss 0 seeks to start, -vframes 1 gets only 1 frame, -q:v 5 is faster than 2
@@ -1731,38 +2658,111 @@ class SlideshowManager(QMainWindow):
                 # Try again with longer timeout
                 result = subprocess.run(cmd, capture_output=True, timeout=60)
 
-            if result.returncode == 0 and Path(tmp_path).exists():
+            if result.returncode == 0 and os.path.getsize(tmp_path) > 0:
                 logger.debug(f"Successfully extracted frame from {video_path.name}")
-                return tmp_path
+                os.replace(tmp_path, frame_path)
+                return str(frame_path)
             else:
                 logger.error(f"Failed to extract frame from {video_path}")
-                if Path(tmp_path).exists():
-                    Path(tmp_path).unlink()
+                os.unlink(tmp_path)
                 return None
         except subprocess.TimeoutExpired:
             logger.error(f"FFmpeg timeout extracting frame from {video_path.name} (>60s)")
-            if Path(tmp_path).exists():
-                Path(tmp_path).unlink()
+            os.unlink(tmp_path)
             return None
         except Exception as e:
             logger.error(f"Error extracting video frame: {e}", exc_info=True)
-            if Path(tmp_path).exists():
-                Path(tmp_path).unlink()
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
             return None
     
+    def _pipe_first_frame(self, video_path, max_size):
+        """Decode a video's first frame, scaled to fit max_size, over an ffmpeg pipe; PIL image or None."""
+        cmd = [
+            'ffmpeg', '-loglevel', 'error',
+            '-ss', '0', '-i', str(video_path),
+            '-frames:v', '1',
+            '-vf', f'scale={max_size[0]}:{max_size[1]}:force_original_aspect_ratio=decrease:flags=fast_bilinear',
+            # PPM carries its own size and needs no compression, unlike a PNG on disk
+            '-f', 'image2pipe', '-c:v', 'ppm', 'pipe:1'
+        ]
+        try:
+            result = subprocess.run(cmd, capture_output=True, timeout=30, check=True)
+            return Image.open(BytesIO(result.stdout))
+        except Exception as e:
+            logger.debug(f"Could not pipe a frame out of {video_path.name}: {e}")
+            return None
+
+    def _extract_frames_batch(self, video_paths, max_size=None):
+        """Extract the first frame of several videos with one ffmpeg run; returns {path: frame_path}.
+
+        With max_size=(w, h) ffmpeg scales each frame to fit inside that box and
+        writes it as uncompressed PPM, since such frames are read once and deleted.
+        If the run fails (e.g. one input has no video stream) nothing is returned,
+        and callers fall back to extract_video_first_frame per video.
+        """
+        if not video_paths:
+            return {}
+        cmd = ['ffmpeg', '-y', '-loglevel', 'error']
+        for video_path in video_paths:
+            cmd += ['-ss', '0', '-i', str(video_path)]
+        scale = []
+        if max_size:
+            scale = ['-vf', f'scale={max_size[0]}:{max_size[1]}:force_original_aspect_ratio=decrease:flags=fast_bilinear']
+        frame_paths = []
+        for i in range(len(video_paths)):
+            fd, frame_path = tempfile.mkstemp(suffix='.ppm' if max_size else '.png')
+            os.close(fd)
+            frame_paths.append(frame_path)
+            cmd += ['-map', f'{i}:v:0', '-frames:v', '1', *scale, '-q:v', '5', frame_path]
+
+        try:
+            result = subprocess.run(cmd, capture_output=True, timeout=30 + 5 * len(video_paths))
+            ok = result.returncode == 0
+            if not ok:
+                logger.warning(f"Batched frame extraction failed: {result.stderr.decode(errors='replace')[:200]}")
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.warning(f"Batched frame extraction failed: {e}")
+            ok = False
+
+        frames = {}
+        for video_path, frame_path in zip(video_paths, frame_paths):
+            if ok and os.path.getsize(frame_path) > 0:
+                frames[video_path] = frame_path
+            else:
+                os.unlink(frame_path)
+        logger.debug(f"Extracted {len(frames)}/{len(video_paths)} first frames in one ffmpeg run")
+        return frames
+
     def load_images(self):
         """Load images and videos from directory."""
         try:
             if not IMAGES_DIR.exists():
                 IMAGES_DIR.mkdir(parents=True, exist_ok=True)
 
-            # Load both images and videos
-            all_files = sorted([
-                f for f in IMAGES_DIR.glob('*')
-                if f.suffix.lower() in SUPPORTED_FORMATS or f.suffix.lower() in VIDEO_FORMATS
-            ])
+            # Load both images and videos, noting which are videos once so later
+            # checks are a set lookup instead of a suffix.lower() per call
+            all_files = []
+            videos = set()
+            stats = {}
+            for f in IMAGES_DIR.glob('*'):
+                suffix = f.suffix.lower()
+                if suffix in VIDEO_FORMATS:
+                    videos.add(f)
+                elif suffix not in SUPPORTED_FORMATS:
+                    continue
+                all_files.append(f)
+                # Stat once here; statistics and tooltips reuse it until the next reload
+                try:
+                    stats[f] = f.stat()
+                except OSError:
+                    pass
+            all_files.sort()
 
             self.images = all_files
+            self.video_paths = frozenset(videos)
+            self.image_stats = stats
+            self.images_bytes = sum(st.st_size for st in stats.values())
 
             # Reset selected images when reloading (to avoid stale indices)
             self.selected_images = set(range(len(self.images)))
@@ -1778,57 +2778,136 @@ class SlideshowManager(QMainWindow):
     
     def update_thumbnails(self):
         """Update thumbnail grid with lazy loading."""
-        # Clear existing thumbnails
-        while self.thumbnails_layout.count():
-            self.thumbnails_layout.takeAt(0).widget().deleteLater()
+        self.stop_loading = False
+        pending_videos = []  # [(index, path)] not in memory yet
+        with bulk_layout(self.thumbnails_widget):
+            # Only delete buttons whose files are gone; the rest are reused below
+            new_paths = set(self.images)
+            for img_path in set(self.thumbnail_buttons) - new_paths:
+                btn = self.thumbnail_buttons.pop(img_path)
+                self.thumbnails_layout.removeWidget(btn)
+                btn.deleteLater()
+
+            # Create placeholder buttons and load PNG thumbnails immediately (fast)
+            for i, img_path in enumerate(self.images):
+                try:
+                    btn = self.thumbnail_buttons.get(img_path)
+                    if btn is not None:
+                        # Existing button: move it to its new grid cell if its index changed
+                        if btn.index != i:
+                            self.thumbnails_layout.removeWidget(btn)
+                            self.thumbnails_layout.addWidget(btn, i // THUMBNAIL_COLUMNS, i % THUMBNAIL_COLUMNS)
+                            btn.index = i
+                        self._update_thumbnail_border(btn, i)
+                        if btn.icon().isNull() and img_path in self.video_paths:
+                            pending_videos.append((i, img_path))
+                        # Image thumbnails still in flight land by path once decoded
+                        continue
+
+                    btn = self._create_placeholder_thumbnail(i, img_path)
+                    self.thumbnail_buttons[img_path] = btn
+                    self.thumbnails_layout.addWidget(btn, i // THUMBNAIL_COLUMNS, i % THUMBNAIL_COLUMNS)
+
+                    # Thumbnails come from memory or the disk cache when possible (no frame
+                    # extraction for videos); misses are decoded in parallel, images by the
+                    # process pool and videos by the thumb_pool loader below
+                    pixmap = cached_thumbnail(img_path) or self.thumb_disk_cache.load(img_path)
+                    if pixmap:
+                        cache_thumbnail(img_path, pixmap)
+                        self._update_thumbnail_ui(btn, pixmap)
+                    elif img_path in self.video_paths:
+                        pending_videos.append((i, img_path))
+                    else:
+                        self._submit_thumbnail(i, img_path)
+                except Exception as e:
+                    logger.error(f"Error creating placeholder for {img_path}: {e}")
 
-        self.thumbnail_buttons = {}
+        # Start pool workers to load VIDEO thumbnails only, visible ones first
         self.stop_loading = False
+        with self._thumb_lock:
+            self._thumb_generation += 1
+            self._thumb_pending = dict(pending_videos)
+            self._thumb_queue = queue.LifoQueue()
+            self._thumb_backlog = deque(i for i, _ in pending_videos)
+        self._enqueue_visible_thumbs()
+        batches = -(-len(pending_videos) // FRAME_BATCH_SIZE)
+        for _ in range(min(VIDEO_THUMBNAIL_WORKERS, batches)):
+            self.thumb_pool.start(_VideoThumbnailJob(self, self._thumb_generation))
+
+    def _enqueue_visible_thumbs(self, *_):
+        """Move pending thumbnails in and around the viewport to the front of the load order."""
+        if not self._thumb_pending or not self.thumbnail_buttons:
+            return
+        bar = self.thumbnails_scroll.verticalScrollBar()
+        row_height = next(iter(self.thumbnail_buttons.values())).height() + self.thumbnails_layout.verticalSpacing()
+        first_row = max(bar.value() // row_height - THUMBNAIL_PREFETCH_ROWS, 0)
+        last_row = (bar.value() + self.thumbnails_scroll.viewport().height()) // row_height + THUMBNAIL_PREFETCH_ROWS
+        # Pushed last-to-first so the top-left visible thumbnail is popped first
+        for i in reversed(range(first_row * THUMBNAIL_COLUMNS, (last_row + 1) * THUMBNAIL_COLUMNS)):
+            if i in self._thumb_pending:
+                self._thumb_queue.put(i)
+
+    def _next_thumbnail_batch(self):
+        """Take up to FRAME_BATCH_SIZE pending videos, viewport first (loader thread)."""
+        batch = []
+        with self._thumb_lock:
+            while len(batch) < FRAME_BATCH_SIZE:
+                try:
+                    i = self._thumb_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if i in self._thumb_pending:
+                    batch.append((i, self._thumb_pending.pop(i)))
+            while len(batch) < FRAME_BATCH_SIZE and self._thumb_backlog:
+                i = self._thumb_backlog.popleft()
+                if i in self._thumb_pending:
+                    batch.append((i, self._thumb_pending.pop(i)))
+        return batch
+
+    def _submit_thumbnail(self, index, img_path):
+        """Decode an image thumbnail in the process pool; the result arrives via thumbnail_data_ready."""
+        if self.thumb_executor is None:
+            # spawn: forking a process that is already running Qt threads is unsafe
+            self.thumb_executor = ProcessPoolExecutor(
+                max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn")
+            )
+        future = self.thumb_executor.submit(_make_thumb, str(img_path))
 
-        # Create placeholder buttons and load PNG thumbnails immediately (fast)
-        for i, img_path in enumerate(self.images):
+        def done(future):
+            # Runs on the executor's thread; the signal hands the data to the GUI thread
+            if future.cancelled():  # only happens when the window closes
+                return
             try:
-                btn = self._create_placeholder_thumbnail(i, img_path)
-                self.thumbnail_buttons[i] = btn
-                self.thumbnails_layout.addWidget(btn, i // 6, i % 6)
-
-                # Load PNG/JPG thumbnails immediately on main thread (they're fast)
-                if img_path.suffix.lower() in SUPPORTED_FORMATS:
-                    pixmap = self._load_single_thumbnail(img_path)
-                    if pixmap:
-                        self.thumbnail_cache[img_path] = pixmap
-                        self._update_thumbnail_ui(btn, pixmap)
+                data = future.result()
             except Exception as e:
-                logger.error(f"Error creating placeholder for {img_path}: {e}")
+                logger.error(f"Error loading thumbnail for {img_path.name}: {e}")
+                data = None
+            try:
+                self.thumbnail_data_ready.emit(index, img_path, data)
+            except RuntimeError:  # window already destroyed
+                pass
 
-        # Start background thread to load VIDEO thumbnails only
-        self.stop_loading = False
-        self.thumbnail_loader_thread = threading.Thread(target=self._load_video_thumbnails_background, daemon=True)
-        self.thumbnail_loader_thread.start()
+        future.add_done_callback(done)
+
+    def _on_thumbnail_data(self, index, img_path, data):
+        """Show a thumbnail decoded by the process pool (GUI thread)."""
+        pixmap = QPixmap()
+        if not data or not pixmap.loadFromData(data):
+            return
+        cache_thumbnail(img_path, pixmap)
+        btn = self.thumbnail_buttons.get(img_path)
+        if btn is not None:
+            self._update_thumbnail_ui(btn, pixmap)
 
     def _create_placeholder_thumbnail(self, index, img_path):
         """Create a fast placeholder thumbnail with drag support."""
-        btn = QPushButton()
+        btn = GalleryThumbnail(img_path, index)
         btn.setFixedSize(130, 130)
-        btn.setCursor(Qt.PointingHandCursor)
         btn.setFlat(True)
-        btn.index = index
-        btn.img_path = img_path
-        btn.drag_start_position = None
-
-        # Different behavior for videos vs images
-        is_video = img_path.suffix.lower() in VIDEO_FORMATS
-        if is_video:
-            # Videos: Single click plays, Ctrl+click toggles selection
-            btn.clicked.connect(lambda: self.on_thumbnail_clicked(index, img_path))
-        else:
-            # Images: Click toggles selection
-            btn.clicked.connect(lambda: self.toggle_image_selection(index, None))
 
-        # Enable drag-and-drop for timeline
-        btn.mousePressEvent = lambda event: self._thumbnail_mouse_press(btn, event)
-        btn.mouseMoveEvent = lambda event: self._thumbnail_mouse_move(btn, event)
-        btn.mouseReleaseEvent = lambda event: self._thumbnail_mouse_release(btn, event)
+        # Videos: single click plays, Ctrl+click toggles selection; images: click toggles selection
+        is_video = img_path in self.video_paths
+        btn.clicked.connect(self._on_gallery_thumbnail_clicked)
 
         # Set placeholder text
         btn.setText("📹" if is_video else "🖼️")
@@ -1838,7 +2917,7 @@ class SlideshowManager(QMainWindow):
 
         # Set tooltip
         try:
-            file_size = img_path.stat().st_size / 1024
+            file_size = self.image_stats[img_path].st_size / 1024
             file_name = img_path.name
             file_type = "Video" if is_video else "Image"
             if is_video:
@@ -1851,35 +2930,43 @@ class SlideshowManager(QMainWindow):
 
         return btn
 
-    def _load_video_thumbnails_background(self):
-        """Load VIDEO thumbnails in background thread (PNG/JPG are loaded on main thread)."""
-        for i, img_path in enumerate(self.images):
-            if self.stop_loading:
+    def _load_video_thumbnails_background(self, generation):
+        """Load VIDEO thumbnails on a thumb_pool thread (PNG/JPG go through the process pool)."""
+        while not self.stop_loading and generation == self._thumb_generation:
+            batch = self._next_thumbnail_batch()
+            if not batch:
                 break
 
-            # Only process videos in background thread
-            if img_path.suffix.lower() not in VIDEO_FORMATS:
-                continue
-
-            try:
-                # Skip if already cached
-                if img_path in self.thumbnail_cache:
-                    pixmap = self.thumbnail_cache[img_path]
-                else:
-                    pixmap = self._load_single_thumbnail(img_path)
-                    if pixmap:
-                        self.thumbnail_cache[img_path] = pixmap
-
-                # Update button on main thread using QTimer
-                # Store pixmap in cache BEFORE scheduling UI update to prevent garbage collection
-                if i in self.thumbnail_buttons and pixmap:
-                    btn = self.thumbnail_buttons[i]
-                    # Create a wrapper function to ensure strong references
-                    def update_ui(button=btn, pm=pixmap):
-                        self._update_thumbnail_ui(button, pm)
-                    QTimer.singleShot(0, update_ui)
-            except Exception as e:
-                logger.error(f"Error loading video thumbnail {i}: {e}")
+            # Extract the first frames the batch still needs in a single ffmpeg run,
+            # already scaled down; they only feed thumbnails, so they stay out of
+            # video_frame_cache (whose full-size frames the slideshow builder reuses).
+            # With PyAV, _load_single_thumbnail decodes them in-process instead.
+            small_frames = {}
+            if av is None:
+                missing = [img_path for _, img_path in batch
+                           if img_path not in self.video_frame_cache and not self.thumb_disk_cache.contains(img_path)]
+                small_frames = self._extract_frames_batch(missing, max_size=THUMBNAIL_FRAME_SIZE)
+
+            for i, img_path in batch:
+                if self.stop_loading:
+                    break
+                try:
+                    # QPixmaps may only be built on the GUI thread, so hand over the
+                    # encoded data; _on_thumbnail_data caches and shows it
+                    frame_path = small_frames.pop(img_path, None)
+                    if frame_path:
+                        try:
+                            data = self._thumbnail_from_frame(img_path, frame_path)
+                        finally:
+                            os.unlink(frame_path)
+                    else:
+                        data = self._load_single_thumbnail(img_path)
+                    if data:
+                        self.thumbnail_data_ready.emit(i, img_path, data)
+                except Exception as e:
+                    logger.error(f"Error loading video thumbnail {i}: {e}")
+            for frame_path in small_frames.values():
+                os.unlink(frame_path)  # left over when loading was stopped
 
     def _update_thumbnail_ui(self, btn, pixmap):
         """Update thumbnail UI on main thread."""
@@ -1896,43 +2983,91 @@ class SlideshowManager(QMainWindow):
         except Exception as e:
             logger.error(f"Error updating thumbnail UI: {e}")
 
+    def _decode_first_frame(self, video_path, max_size=None):
+        """Decode the first keyframe of a video with PyAV as a PIL image, or None on failure."""
+        try:
+            with av.open(str(video_path)) as container:
+                stream = container.streams.video[0]
+                # Only decode keyframes; the first one is all we need
+                stream.codec_context.skip_frame = "NONKEY"
+                frame = next(container.decode(stream))
+                if max_size:
+                    # Let libswscale shrink the frame before it is converted to RGB
+                    scale = min(max_size[0] / frame.width, max_size[1] / frame.height, 1)
+                    frame = frame.reformat(width=max(2, round(frame.width * scale)) & ~1,
+                                           height=max(2, round(frame.height * scale)) & ~1,
+                                           interpolation="FAST_BILINEAR")
+                return frame.to_image()
+        except Exception as e:
+            logger.debug(f"PyAV could not decode {video_path.name}: {e}")
+            return None
+
+    def _thumbnail_from_frame(self, video_path, frame_path):
+        """Turn an extracted video frame into cached WebP thumbnail data."""
+        with Image.open(frame_path) as img:
+            img.thumbnail(THUMBNAIL_SIZE, THUMBNAIL_RESAMPLE)
+            return self.thumb_disk_cache.store(video_path, img)
+
+    def _cached_frame(self, video_path):
+        """Get a video's extracted first frame from video_frame_cache, marking it recently used."""
+        with self._frame_cache_lock:
+            frame_path = self.video_frame_cache.get(video_path)
+            if frame_path is not None:
+                self.video_frame_cache.move_to_end(video_path)
+            return frame_path
+
+    def _remember_frame(self, video_path, frame_path):
+        """Add a frame to video_frame_cache, dropping the least recently used past VIDEO_FRAME_CACHE_ENTRIES."""
+        with self._frame_cache_lock:
+            self.video_frame_cache[video_path] = frame_path
+            self.video_frame_cache.move_to_end(video_path)
+            while len(self.video_frame_cache) > VIDEO_FRAME_CACHE_ENTRIES:
+                self.video_frame_cache.popitem(last=False)
+
     def _load_single_thumbnail(self, img_path):
-        """Load a single thumbnail (can be called from background thread)."""
+        """Load a single thumbnail as WebP data (can be called from background thread)."""
         try:
+            # Thumbnails decoded in an earlier run are reused straight from disk
+            data = self.thumb_disk_cache.load_bytes(img_path)
+            if data:
+                return data
+
             if img_path.suffix.lower() in VIDEO_FORMATS:
                 logger.debug(f"Loading video thumbnail: {img_path.name}")
+                if img_path not in self.video_frame_cache and not self.frame_disk_cache.contains(img_path):
+                    # No full-size frame to reuse: decode a small one in memory (in-process
+                    # with PyAV, else over an ffmpeg pipe) instead of going through a PNG file
+                    img = None
+                    if av is not None:
+                        img = self._decode_first_frame(img_path, max_size=THUMBNAIL_FRAME_SIZE)
+                    if img is None:
+                        img = self._pipe_first_frame(img_path, THUMBNAIL_FRAME_SIZE)
+                    if img is not None:
+                        img.thumbnail(THUMBNAIL_SIZE, THUMBNAIL_RESAMPLE)
+                        return self.thumb_disk_cache.store(img_path, img)
+
                 # Extract first frame from video
-                if img_path in self.video_frame_cache:
-                    frame_path = self.video_frame_cache[img_path]
+                frame_path = self._cached_frame(img_path)
+                if frame_path:
                     logger.debug(f"Using cached frame for {img_path.name}")
                 else:
                     logger.debug(f"Extracting frame from {img_path.name}")
                     frame_path = self.extract_video_first_frame(img_path)
                     if frame_path:
-                        self.video_frame_cache[img_path] = frame_path
+                        self._remember_frame(img_path, frame_path)
                         logger.debug(f"Cached frame for {img_path.name}")
                     else:
                         logger.warning(f"Failed to extract frame from {img_path.name}")
 
                 if frame_path:
                     logger.debug(f"Opening frame file: {frame_path}")
-                    img = Image.open(frame_path)
-                    img.thumbnail(THUMBNAIL_SIZE, Image.Resampling.LANCZOS)
-                    pixmap = self._pil_to_qpixmap(img)
-                    if pixmap:
-                        logger.debug(f"Successfully created pixmap for {img_path.name}")
-                    return pixmap
+                    return self._thumbnail_from_frame(img_path, frame_path)
                 else:
                     logger.warning(f"No frame path for {img_path.name}")
             else:
                 # Regular image file
                 logger.debug(f"Loading image thumbnail: {img_path.name}")
-                img = Image.open(img_path)
-                img.thumbnail(THUMBNAIL_SIZE, Image.Resampling.LANCZOS)
-                pixmap = self._pil_to_qpixmap(img)
-                if pixmap:
-                    logger.debug(f"Successfully created pixmap for {img_path.name}")
-                return pixmap
+                return self.thumb_disk_cache.store(img_path, _thumbnail_image(img_path))
         except Exception as e:
             logger.error(f"Error loading thumbnail for {img_path.name}: {e}", exc_info=True)
 
@@ -1940,115 +3075,27 @@ class SlideshowManager(QMainWindow):
 
 
 
-    def _pil_to_qpixmap(self, pil_image):
-        """Convert PIL image to QPixmap efficiently."""
-        try:
-            # Ensure image is in RGB mode
-            if pil_image.mode != 'RGB':
-                pil_image = pil_image.convert('RGB')
-
-            # Use PIL's built-in toqimage method if available, otherwise use temp file
-            try:
-                # Try direct conversion using PIL's internal method
-                from PIL.ImageQt import ImageQt
-                qimage = ImageQt(pil_image)
-                return QPixmap.fromImage(qimage)
-            except:
-                # Fallback: save to temp file and load
-                with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                    tmp_path = tmp.name
-                pil_image.save(tmp_path, 'PNG')
-                pixmap = QPixmap(tmp_path)
-                Path(tmp_path).unlink()  # Delete temp file
-                return pixmap
-        except Exception as e:
-            logger.error(f"Error converting PIL to QPixmap: {e}")
-            return None
-
     def _update_thumbnail_border(self, btn, index):
         """Update thumbnail border color based on selection state."""
         is_selected = index in self.selected_images
 
-        # Check if it's a video selected for playlist
-        is_video_selected_for_playlist = False
-        if hasattr(btn, 'img_path'):
-            is_video_selected_for_playlist = str(btn.img_path) in self.selected_videos_for_playlist
-
-        # Use brighter green for videos selected for playlist
-        if is_video_selected_for_playlist:
-            border_color = "#00ff00"  # Bright green for playlist selection
-            border_width = "4px"
-        elif is_selected:
-            border_color = "#00ff00"  # Green for regular selection
-            border_width = "4px"
-        else:
-            border_color = "#3d3d3d"  # Gray if not selected
-            border_width = "2px"
-
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                border: {border_width} solid {border_color};
-                border-radius: 4px;
-                padding: 0px;
-                background-color: #2b2b2b;
-            }}
-            QPushButton:hover {{
-                border: 4px solid #4a9eff;
-            }}
-        """)
-
-    def _thumbnail_mouse_press(self, btn, event):
-        """Handle mouse press on thumbnail for drag-and-drop."""
-        if event.button() == Qt.LeftButton:
-            btn.drag_start_position = event.pos()
-        QPushButton.mousePressEvent(btn, event)
-
-    def _thumbnail_mouse_move(self, btn, event):
-        """Handle mouse move on thumbnail to start drag."""
-        if not (event.buttons() & Qt.LeftButton):
-            return
-        if not hasattr(btn, 'drag_start_position') or btn.drag_start_position is None:
-            return
-        if (event.pos() - btn.drag_start_position).manhattanLength() < QApplication.startDragDistance():
-            return
-
-        # Start drag operation
-        drag = QDrag(btn)
-        mime_data = QMimeData()
-
-        # Store file path
-        mime_data.setText(str(btn.img_path))
-        mime_data.setData("application/x-slideshow-file", str(btn.img_path).encode())
-
-        drag.setMimeData(mime_data)
-
-        # Set drag pixmap (thumbnail preview)
-        if hasattr(btn, 'icon') and not btn.icon().isNull():
-            pixmap = btn.icon().pixmap(80, 80)
-            drag.setPixmap(pixmap)
-        elif btn.img_path in self.thumbnail_cache:
-            pixmap = self.thumbnail_cache[btn.img_path]
-            drag.setPixmap(pixmap.scaled(80, 80, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-        else:
-            # Create simple pixmap
-            pixmap = QPixmap(80, 80)
-            pixmap.fill(QColor("#2a2a2a"))
-            painter = QPainter(pixmap)
-            painter.setPen(QColor("white"))
-            painter.setFont(QFont("Arial", 32))
-            is_video = btn.img_path.suffix.lower() in VIDEO_FORMATS
-            painter.drawText(pixmap.rect(), Qt.AlignCenter, "📹" if is_video else "🖼️")
-            painter.end()
-            drag.setPixmap(pixmap)
+        # Videos selected for the playlist get the same green border
+        if not is_selected and hasattr(btn, 'img_path'):
+            is_selected = btn.img_path in self.selected_videos_for_playlist
 
-        drag.setHotSpot(QPoint(40, 40))
+        style = _THUMB_QSS_SELECTED if is_selected else _THUMB_QSS_NORMAL
+        # Setting a stylesheet re-polishes the button even when nothing changed
+        if btn.styleSheet() != style:
+            btn.setStyleSheet(style)
 
-        # Execute drag
-        drag.exec_(Qt.CopyAction)
+    def _on_gallery_thumbnail_clicked(self):
+        """Dispatch a click from any gallery GalleryThumbnail."""
+        btn = self.sender()
+        self.on_thumbnail_clicked(btn.index, btn.img_path)
 
-    def _thumbnail_mouse_release(self, btn, event):
-        """Handle mouse release on thumbnail."""
-        QPushButton.mouseReleaseEvent(btn, event)
+    def _on_video_grid_thumbnail_clicked(self):
+        """Dispatch a click from any video grid GalleryThumbnail."""
+        self.on_video_grid_thumbnail_clicked(self.sender().img_path)
 
     def on_thumbnail_clicked(self, index, img_path):
         """Handle thumbnail click - play video or toggle selection based on modifiers."""
@@ -2059,11 +3106,11 @@ class SlideshowManager(QMainWindow):
             self.toggle_image_selection(index, None)
 
             # If it's a video, also add to selected videos for playlist
-            if img_path.suffix.lower() in VIDEO_FORMATS:
+            if img_path in self.video_paths:
                 self.toggle_video_selection_for_playlist(img_path)
         else:
             # Regular click on video: Play it
-            if img_path.suffix.lower() in VIDEO_FORMATS:
+            if img_path in self.video_paths:
                 self.play_video_from_thumbnail(img_path)
             else:
                 # For images, just toggle selection
@@ -2081,32 +3128,34 @@ class SlideshowManager(QMainWindow):
 
     def toggle_video_selection_for_playlist(self, video_path):
         """Toggle video selection for playlist."""
-        video_path_str = str(video_path)
-
-        if video_path_str in self.selected_videos_for_playlist:
-            self.selected_videos_for_playlist.discard(video_path_str)
+        if video_path in self.selected_videos_for_playlist:
+            self.selected_videos_for_playlist.discard(video_path)
             logger.info(f"Deselected video for playlist: {video_path.name}")
             self.log_event(f"☐ Deselected: {video_path.name}")
         else:
-            self.selected_videos_for_playlist.add(video_path_str)
+            self.selected_videos_for_playlist.add(video_path)
             logger.info(f"Selected video for playlist: {video_path.name}")
             self.log_event(f"☑️ Selected: {video_path.name}")
 
         # Update the selected videos counter
         self.update_selected_videos_counter()
 
-        # Refresh the video grid to update visual feedback (if visible)
-        if self.player_stack.currentIndex() == 1:
-            self.show_video_grid()
-
-        # Also update main gallery thumbnails
-        if hasattr(self, 'thumbnails_layout'):
-            for i in range(self.thumbnails_layout.count()):
-                widget = self.thumbnails_layout.itemAt(i).widget()
-                if isinstance(widget, QPushButton) and hasattr(widget, 'img_path'):
-                    if str(widget.img_path) == video_path_str:
-                        self._update_thumbnail_border(widget, widget.index)
-                        break
+        # Restyle just this video's buttons in the video grid and the main gallery
+        btn = self.video_grid_buttons.get(video_path)
+        if btn is not None:
+            self._update_video_grid_border(btn)
+        btn = self.thumbnail_buttons.get(video_path)
+        if btn is not None:
+            self._update_thumbnail_border(btn, btn.index)
+
+    def _update_video_grid_border(self, btn):
+        """Update a video grid button's border based on playlist selection."""
+        is_selected = btn.video_path in self.selected_videos_for_playlist
+        style = _VIDEO_GRID_QSS_SELECTED if is_selected else _VIDEO_GRID_QSS_NORMAL
+        if btn.icon().isNull():
+            style += "font-size: 48px;"  # placeholder emoji
+        if btn.styleSheet() != style:
+            btn.setStyleSheet(style)
 
     def update_selected_videos_counter(self):
         """Update the selected videos counter label."""
@@ -2147,14 +3196,11 @@ class SlideshowManager(QMainWindow):
         else:
             self.selected_images.add(index)
 
-        # Update border color for this thumbnail
-        if hasattr(self, 'thumbnails_layout'):
-            # Find and update the button
-            for i in range(self.thumbnails_layout.count()):
-                widget = self.thumbnails_layout.itemAt(i).widget()
-                if isinstance(widget, QPushButton) and hasattr(widget, 'index') and widget.index == index:
-                    self._update_thumbnail_border(widget, index)
-                    break
+        # Update border color for this thumbnail (buttons are keyed by path)
+        if 0 <= index < len(self.images):
+            btn = self.thumbnail_buttons.get(self.images[index])
+            if btn is not None:
+                self._update_thumbnail_border(btn, index)
 
         # Update statistics
         self.update_statistics()
@@ -2184,10 +3230,13 @@ class SlideshowManager(QMainWindow):
     def _update_all_thumbnail_borders(self):
         """Update all thumbnail borders without recreating them."""
         if hasattr(self, 'thumbnails_layout'):
-            for i in range(self.thumbnails_layout.count()):
-                widget = self.thumbnails_layout.itemAt(i).widget()
-                if isinstance(widget, QPushButton) and hasattr(widget, 'index'):
-                    self._update_thumbnail_border(widget, widget.index)
+            # Repaint the grid once instead of once per button
+            self.thumbnails_widget.setUpdatesEnabled(False)
+            try:
+                for btn in self.thumbnail_buttons.values():
+                    self._update_thumbnail_border(btn, btn.index)
+            finally:
+                self.thumbnails_widget.setUpdatesEnabled(True)
 
     def update_statistics(self):
         """Update statistics display."""
@@ -2195,7 +3244,7 @@ class SlideshowManager(QMainWindow):
         hidden = len(self.hidden_images)
         visible = total - hidden
         selected = len(self.selected_images) if hasattr(self, 'selected_images') else total
-        size_mb = sum(f.stat().st_size for f in self.images) / (1024 * 1024)
+        size_mb = self.images_bytes / (1024 * 1024)
 
         stats_text = f"Total: {total} | Selected: {selected} | Visible: {visible} | Hidden: {hidden} | Size: {size_mb:.1f} MB"
         self.stats_label.setText(stats_text)
@@ -2203,6 +3252,15 @@ class SlideshowManager(QMainWindow):
     def show_available_videos(self):
         """Show available videos in the combo box."""
         try:
+            # Adding, removing or renaming a slideshow bumps the directory's mtime;
+            # while it is unchanged the combo already lists the right files
+            try:
+                dir_mtime = OUTPUT_DIR.stat().st_mtime_ns
+            except OSError:
+                dir_mtime = None
+            if dir_mtime is not None and dir_mtime == self._videos_dir_mtime:
+                return
+
             self.available_videos = sorted([
                 f for f in OUTPUT_DIR.glob('slideshow_*.mp4')
             ])
@@ -2212,12 +3270,14 @@ class SlideshowManager(QMainWindow):
             self.video_combo.clear()
 
             for video in self.available_videos:
-                size_mb = video.stat().st_size / (1024 * 1024)
-                mtime = datetime.fromtimestamp(video.stat().st_mtime).strftime('%Y-%m-%d %H:%M')
+                st = video.stat()
+                size_mb = st.st_size / (1024 * 1024)
+                mtime = datetime.fromtimestamp(st.st_mtime).strftime('%Y-%m-%d %H:%M')
                 display_text = f"{video.name} ({size_mb:.1f} MB) - {mtime}"
                 self.video_combo.addItem(display_text, userData=str(video))
 
             self.video_combo.blockSignals(False)
+            self._videos_dir_mtime = dir_mtime
 
             if self.available_videos:
                 logger.info(f"Showing {len(self.available_videos)} videos")
@@ -2271,8 +3331,38 @@ class SlideshowManager(QMainWindow):
             logger.error(f"Error toggling play/pause: {e}")
             self.log_event(f"❌ Error: {e}")
 
+    def _ensure_player(self):
+        """Create the VLC instance and media player and attach it to vlc_widget, on first use."""
+        if self._media_player is None:
+            # FIXED: Use media_player_new() instead of media_list_player_new()
+            self._vlc_instance = vlc.Instance()
+            self._media_player = self._vlc_instance.media_player_new()
+
+            # CRITICAL FIX: Attach VLC to the widget's window handle
+            # This is platform-specific and required for embedded playback
+            if sys.platform.startswith('linux'):  # Linux using X Server
+                self._media_player.set_xwindow(int(self.vlc_widget.winId()))
+            elif sys.platform == "win32":  # Windows
+                self._media_player.set_hwnd(int(self.vlc_widget.winId()))
+            elif sys.platform == "darwin":  # macOS
+                self._media_player.set_nsobject(int(self.vlc_widget.winId()))
+
+    @property
+    def media_player(self):
+        """The VLC media player, created and attached to vlc_widget on first use."""
+        self._ensure_player()
+        return self._media_player
+
+    @property
+    def vlc_instance(self):
+        """The VLC instance behind media_player."""
+        self._ensure_player()
+        return self._vlc_instance
+
     def update_timestamp(self):
         """Update the timestamp display and seek slider with current playback time."""
+        if self._media_player is None:  # nothing has been played yet
+            return
         try:
             current_state = self.media_player.get_state()
 
@@ -2567,86 +3657,63 @@ class SlideshowManager(QMainWindow):
     def show_video_grid(self):
         """Display video thumbnails in the player area when stopped."""
         try:
-            # Clear existing grid
-            while self.video_grid_layout.count():
-                item = self.video_grid_layout.takeAt(0)
-                if item.widget():
-                    item.widget().deleteLater()
-
             # Get all video files
-            video_files = [img for img in self.images if img.suffix.lower() in VIDEO_FORMATS]
-
-            if not video_files:
-                # No videos, show message
-                label = QLabel("No videos available")
-                label.setStyleSheet("color: #888; font-size: 16px;")
-                label.setAlignment(Qt.AlignCenter)
-                self.video_grid_layout.addWidget(label, 0, 0)
-                self.player_stack.setCurrentIndex(1)
-                return
-
-            # Create thumbnail buttons for videos (4 per row)
-            for i, video_path in enumerate(video_files):
-                row = i // 4
-                col = i % 4
-
-                # Create button with drag support
-                btn = QPushButton()
-                btn.setFixedSize(150, 150)
-                btn.setCursor(Qt.PointingHandCursor)
-                btn.video_path = video_path  # Store video path for later reference
-                btn.drag_start_position = None
-                btn.img_path = video_path  # For consistency with main gallery
-
-                # Check if this video is selected
-                is_selected = str(video_path) in self.selected_videos_for_playlist
-                border_color = "#00ff00" if is_selected else "#3a3a3a"
-                border_width = "4px" if is_selected else "2px"
-
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: #2a2a2a;
-                        border: {border_width} solid {border_color};
-                        border-radius: 8px;
-                        color: white;
-                        font-size: 14px;
-                    }}
-                    QPushButton:hover {{
-                        border: 4px solid #4a9eff;
-                        background-color: #3a3a3a;
-                    }}
-                """)
-
-                # Set thumbnail or placeholder
-                if video_path in self.thumbnail_cache:
-                    pixmap = self.thumbnail_cache[video_path]
-                    icon = QIcon(pixmap)
-                    btn.setIcon(icon)
-                    btn.setIconSize(QSize(140, 140))
-                    # Keep references to prevent garbage collection
-                    btn._pixmap = pixmap
-                    btn._icon = icon
-                else:
-                    btn.setText("📹")
-                    btn.setStyleSheet(btn.styleSheet() + "font-size: 48px;")
+            video_files = [img for img in self.images if img in self.video_paths]
+
+            with bulk_layout(self.video_grid_widget):
+                # Clear existing grid, from the back so each takeAt() is O(1)
+                self.video_grid_buttons = {}
+                while self.video_grid_layout.count():
+                    item = self.video_grid_layout.takeAt(self.video_grid_layout.count() - 1)
+                    if item.widget():
+                        item.widget().deleteLater()
+
+                if not video_files:
+                    # No videos, show message
+                    label = QLabel("No videos available")
+                    label.setStyleSheet("color: #888; font-size: 16px;")
+                    label.setAlignment(Qt.AlignCenter)
+                    self.video_grid_layout.addWidget(label, 0, 0)
+                    self.player_stack.setCurrentIndex(1)
+                    return
 
-                # Set tooltip
-                try:
-                    file_size = video_path.stat().st_size / (1024 * 1024)
-                    tooltip = f"{video_path.name}\nSize: {file_size:.1f} MB\n\nClick to play\nCtrl+Click to select\nDrag to timeline"
-                    btn.setToolTip(tooltip)
-                except:
-                    btn.setToolTip(f"{video_path.name}\n\nClick to play\nCtrl+Click to select\nDrag to timeline")
+                # Create thumbnail buttons for videos (4 per row)
+                for i, video_path in enumerate(video_files):
+                    row = i // 4
+                    col = i % 4
+
+                    # Create button with drag support
+                    btn = GalleryThumbnail(video_path)
+                    btn.setFixedSize(150, 150)
+                    btn.video_path = video_path  # Store video path for later reference
+                    self.video_grid_buttons[video_path] = btn
+
+                    # Set thumbnail or placeholder
+                    pixmap = cached_thumbnail(video_path) or self.thumb_disk_cache.load(video_path)
+                    if pixmap is not None:
+                        cache_thumbnail(video_path, pixmap)
+                        icon = QIcon(pixmap)
+                        btn.setIcon(icon)
+                        btn.setIconSize(QSize(140, 140))
+                        # Keep references to prevent garbage collection
+                        btn._pixmap = pixmap
+                        btn._icon = icon
+                    else:
+                        btn.setText("📹")
+                    self._update_video_grid_border(btn)
 
-                # Connect click to handle both play and selection
-                btn.clicked.connect(lambda checked, vp=video_path: self.on_video_grid_thumbnail_clicked(vp))
+                    # Set tooltip
+                    try:
+                        file_size = self.image_stats[video_path].st_size / (1024 * 1024)
+                        tooltip = f"{video_path.name}\nSize: {file_size:.1f} MB\n\nClick to play\nCtrl+Click to select\nDrag to timeline"
+                        btn.setToolTip(tooltip)
+                    except:
+                        btn.setToolTip(f"{video_path.name}\n\nClick to play\nCtrl+Click to select\nDrag to timeline")
 
-                # Enable drag-and-drop
-                btn.mousePressEvent = lambda event, b=btn: self._thumbnail_mouse_press(b, event)
-                btn.mouseMoveEvent = lambda event, b=btn: self._thumbnail_mouse_move(b, event)
-                btn.mouseReleaseEvent = lambda event, b=btn: self._thumbnail_mouse_release(b, event)
+                    # Connect click to handle both play and selection
+                    btn.clicked.connect(self._on_video_grid_thumbnail_clicked)
 
-                self.video_grid_layout.addWidget(btn, row, col)
+                    self.video_grid_layout.addWidget(btn, row, col)
 
             # Switch to video grid view
             self.player_stack.setCurrentIndex(1)
@@ -2678,9 +3745,10 @@ class SlideshowManager(QMainWindow):
 
         added_count = 0
         duplicate_count = 0
+        in_playlist = set(self.current_playlist)  # O(1) duplicate checks below
 
-        for video_path_str in list(self.selected_videos_for_playlist):
-            video_path = Path(video_path_str)
+        for video_path in list(self.selected_videos_for_playlist):
+            video_path_str = str(video_path)
 
             # Validate file exists
             if not video_path.exists():
@@ -2688,12 +3756,13 @@ class SlideshowManager(QMainWindow):
                 continue
 
             # Check for duplicates
-            if video_path_str in self.current_playlist:
+            if video_path_str in in_playlist:
                 duplicate_count += 1
                 continue
 
             # Add to playlist
             self.current_playlist.append(video_path_str)
+            in_playlist.add(video_path_str)
             self.playlist_widget.addItem(video_path.name)
             added_count += 1
             logger.info(f"Added to playlist: {video_path.name}")
@@ -2701,9 +3770,8 @@ class SlideshowManager(QMainWindow):
         # Update timeline with all added videos
         for video_path_str in self.current_playlist:
             video_path = Path(video_path_str)
-            pixmap = self.thumbnail_cache.get(video_path)
-            if str(video_path) not in [str(p) for p in self.timeline_widget.timeline_items]:
-                self.timeline_widget.add_item(video_path_str, pixmap)
+            pixmap = cached_thumbnail(video_path)
+            self.timeline_widget.add_item(video_path_str, pixmap)  # skips items already present
 
         # Clear selection after adding
         self.selected_videos_for_playlist.clear()
@@ -2718,9 +3786,10 @@ class SlideshowManager(QMainWindow):
         self.log_event(message)
         QMessageBox.information(self, "Success", message)
 
-        # Refresh video grid to clear visual selection
-        if self.player_stack.currentIndex() == 1:  # If grid is visible
-            self.show_video_grid()
+        # Clear the visual selection in the video grid and the main gallery
+        for btn in self.video_grid_buttons.values():
+            self._update_video_grid_border(btn)
+        self._update_all_thumbnail_borders()
 
     def add_to_playlist(self):
         """Add selected video from dropdown to playlist."""
@@ -2753,7 +3822,7 @@ class SlideshowManager(QMainWindow):
         self.update_playlist_count()
 
         # Update timeline
-        pixmap = self.thumbnail_cache.get(video_path)
+        pixmap = cached_thumbnail(video_path)
         self.timeline_widget.add_item(str(video_path), pixmap)
 
         self.log_event(f"➕ Added to playlist: {video_path.name}")
@@ -2875,7 +3944,7 @@ class SlideshowManager(QMainWindow):
     def on_timeline_changed(self, file_paths):
         """Handle timeline changes and sync with playlist."""
         # Update playlist to match timeline
-        self.current_playlist = [str(p) for p in file_paths]
+        self.current_playlist = file_paths  # _flush emits a fresh list
 
         # Update playlist widget
         self.playlist_widget.clear()
@@ -2896,7 +3965,7 @@ class SlideshowManager(QMainWindow):
 
         try:
             # Sync timeline to playlist
-            self.current_playlist = [str(p) for p in self.timeline_widget.timeline_items]
+            self.current_playlist = list(self.timeline_widget.timeline_items)
 
             # Update playlist widget to show what's playing
             self.playlist_widget.clear()
@@ -2920,7 +3989,7 @@ class SlideshowManager(QMainWindow):
             return
 
         # Sync timeline to playlist and export
-        self.current_playlist = [str(p) for p in self.timeline_widget.timeline_items]
+        self.current_playlist = list(self.timeline_widget.timeline_items)
         self.export_playlist_ffmpeg()
         self.log_event(f"📤 Exporting timeline ({len(self.timeline_widget.timeline_items)} items)")
 
@@ -2974,7 +4043,8 @@ class SlideshowManager(QMainWindow):
             return
 
         # Show dialog to customize export
-        dialog = PlaylistExportDialog(self.current_playlist, self.db, self)
+        dialog = PlaylistExportDialog(self.current_playlist, self.db, self, self.ffmpeg_worker, self.hw_encoder,
+                                      self.executor)
         dialog.exec_()
 
     def add_images(self):
@@ -3025,14 +4095,14 @@ class SlideshowManager(QMainWindow):
         selected_indices = sorted(self.selected_images.copy())
 
         # Run in background thread to prevent UI lockup
-        thread = threading.Thread(target=self._create_slideshow_worker, args=(ffmpeg_cmd, selected_indices), daemon=True)
-        thread.start()
+        self.executor.submit(self._create_slideshow_worker, ffmpeg_cmd, selected_indices)
 
     def _create_slideshow_worker(self, ffmpeg_cmd, selected_indices):
         """Worker thread for slideshow creation."""
         # Generate output filename
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         output_file = OUTPUT_DIR / f"slideshow_{timestamp}.mp4"
+        temp_dir = None
 
         try:
             # Get selected items in order (indices passed from main thread to avoid race conditions)
@@ -3041,22 +4111,27 @@ class SlideshowManager(QMainWindow):
             self.log_event(f"🎬 Creating slideshow: {output_file.name}")
             self.log_event(f"📊 Processing {len(selected_items)} selected items...")
 
-            # Create temporary directory with symlinks to numbered images
-            temp_dir = Path(".slideshow_temp")
-            temp_dir.mkdir(exist_ok=True)
+            # Create temporary directory with symlinks to numbered images; it lives
+            # under the system temp dir (usually tmpfs), not the working directory
+            temp_dir = Path(tempfile.mkdtemp(prefix=SLIDESHOW_TEMP_PREFIX))
             self.log_event(f"📁 Created temp directory")
 
+            # Extract the videos' first frames up front, several ffmpeg processes at a time
+            videos = [item_path for item_path in selected_items if item_path in self.video_paths]
+            frames = {}
+            if videos:
+                with ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, len(videos))) as pool:
+                    frames = dict(zip(videos, pool.map(self.extract_video_first_frame, videos)))
+
             # Create numbered symlinks with .png extension for FFmpeg image2 demuxer
-            # For videos, extract first frame; for images, create symlink
+            # For videos, link the extracted first frame; for images, the file itself.
+            # temp_dir is a fresh private mkdtemp, so no link name can already exist.
             item_count = 0
             for i, item_path in enumerate(selected_items):
                 link_path = temp_dir / f"{i+1:04d}.png"
-                if link_path.exists():
-                    link_path.unlink()
 
-                if item_path.suffix.lower() in VIDEO_FORMATS:
-                    # Extract first frame from video
-                    frame_path = self.extract_video_first_frame(item_path)
+                if item_path in self.video_paths:
+                    frame_path = frames[item_path]
                     if frame_path:
                         link_path.symlink_to(Path(frame_path).resolve())
                         item_count += 1
@@ -3064,44 +4139,52 @@ class SlideshowManager(QMainWindow):
                         self.log_event(f"⚠️ Failed to extract frame from {item_path.name}")
                 else:
                     # Regular image file
-                    link_path.symlink_to(item_path.resolve())
+                    link_or_symlink(item_path, link_path)
                     item_count += 1
 
             self.log_event(f"🔗 Created {item_count} symlinks")
 
-            # Replace output placeholder in command
-            cmd = ffmpeg_cmd.replace('output.mp4', str(output_file))
-            # Update input pattern to use temp directory
-            cmd = cmd.replace('%04d.png', f'{temp_dir}/%04d.png')
+            # Run FFmpeg directly when the command needs no shell; the placeholders are then
+            # substituted per argument, so paths with spaces need no quoting
+            argv = split_command(ffmpeg_cmd)
+            if argv is not None:
+                cmd = [arg.replace('output.mp4', str(output_file)).replace('%04d.png', f'{temp_dir}/%04d.png')
+                       for arg in argv]
+            else:
+                # Replace output placeholder in command
+                cmd = ffmpeg_cmd.replace('output.mp4', str(output_file))
+                # Update input pattern to use temp directory
+                cmd = cmd.replace('%04d.png', f'{temp_dir}/%04d.png')
 
             self.log_event(f"⚙️ Running FFmpeg command...")
             logger.debug(f"FFmpeg command: {cmd}")
 
-            # Run FFmpeg command with real-time output capture
+            # Run FFmpeg command, streaming stderr to the log as it arrives; only the
+            # last STDERR_TAIL_LINES lines are kept for the error dialog
             process = subprocess.Popen(
                 cmd,
-                shell=True,
-                stdout=subprocess.PIPE,
+                shell=argv is None,
+                stdout=subprocess.DEVNULL,
                 stderr=subprocess.PIPE,
-                text=True
+                text=True,
+                bufsize=1
             )
+            stderr_tail = deque(maxlen=STDERR_TAIL_LINES)
+            reader = threading.Thread(target=drain_lines, args=(process.stderr, stderr_tail, self.log_event),
+                                      daemon=True)
+            reader.start()
 
             # Wait for process with timeout
             try:
-                stdout, stderr = process.communicate(timeout=300)
-                result_returncode = process.returncode
+                result_returncode = process.wait(timeout=SLIDESHOW_TIMEOUT_S)
             except subprocess.TimeoutExpired:
                 process.kill()
-                stdout, stderr = process.communicate()
-                result_returncode = -1
-                self.log_event("❌ FFmpeg command timed out (>300s)")
-                raise subprocess.TimeoutExpired(cmd, 300)
-
-            # Cleanup temp directory
-            for file in temp_dir.glob("*"):
-                file.unlink()
-            temp_dir.rmdir()
-            self.log_event(f"🧹 Cleaned up temporary directory")
+                process.wait()
+                self.log_event(f"❌ FFmpeg command timed out (>{SLIDESHOW_TIMEOUT_S}s)")
+                raise subprocess.TimeoutExpired(cmd, SLIDESHOW_TIMEOUT_S)
+            finally:
+                reader.join(timeout=5)
+            stderr = "\n".join(stderr_tail)
 
             if result_returncode == 0:
                 file_size = output_file.stat().st_size / (1024 * 1024)
@@ -3120,12 +4203,17 @@ class SlideshowManager(QMainWindow):
 
         except subprocess.TimeoutExpired:
             logger.error("FFmpeg command timed out")
-            QMessageBox.critical(self, "Error", "Slideshow creation timed out after 300 seconds")
+            QMessageBox.critical(self, "Error", f"Slideshow creation timed out after {SLIDESHOW_TIMEOUT_S} seconds")
         except Exception as e:
             error_msg = f"{str(e)}\n\n{traceback.format_exc()}"
             self.log_event(f"❌ Error: {str(e)[:50]}")
             logger.error(f"Error creating slideshow: {error_msg}")
             QMessageBox.critical(self, "Error", f"Error creating slideshow:\n{str(e)}")
+        finally:
+            # Cleanup temp directory, also when FFmpeg failed or timed out
+            if temp_dir is not None:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+                self.log_event(f"🧹 Cleaned up temporary directory")
     
     def open_videos_folder(self):
         """Open videos folder in file manager."""
@@ -3142,8 +4230,7 @@ class SlideshowManager(QMainWindow):
             self.log_event("❌ FFmpeg command cannot be empty")
             return
 
-        self.config['ffmpeg_cmd'] = cmd
-        self.save_config()
+        self.set_config('ffmpeg_cmd', cmd)
         self.log_event("✅ FFmpeg command saved")
         logger.info("FFmpeg command saved to config")
 
@@ -3170,6 +4257,15 @@ class SlideshowManager(QMainWindow):
         dialog.setLayout(layout)
         dialog.exec_()
 
+    def _on_export_progress(self, output_file, seconds):
+        logger.debug(f"Exporting {output_file}: {seconds:.1f}s written")
+
+    def _on_export_finished(self, output_file, success):
+        if success:
+            self.log_event(f"✅ Export finished: {output_file}")
+        else:
+            self.log_event(f"❌ Export failed: {output_file}")
+
     def log_event(self, message):
         """Log an event to console."""
         logger.info(message)
@@ -3179,14 +4275,22 @@ class SlideshowManager(QMainWindow):
         try:
             # Stop VLC player
             try:
-                self.media_player.stop()
+                if self._media_player is not None:
+                    self._media_player.stop()
             except:
                 pass
 
-            # Stop background thumbnail loading thread
+            # Write out a config change that is still waiting for its timer
+            if self._config_timer.isActive():
+                self.save_config()
+
+            # Stop background thumbnail loading
             self.stop_loading = True
-            if self.thumbnail_loader_thread and self.thumbnail_loader_thread.is_alive():
-                self.thumbnail_loader_thread.join(timeout=1)
+            self.thumb_pool.clear()
+            self.thumb_pool.waitForDone(1000)
+            if self.thumb_executor is not None:
+                self.thumb_executor.shutdown(wait=False, cancel_futures=True)
+            self.executor.shutdown(wait=False, cancel_futures=True)
 
             logger.info("Slideshow Manager closed gracefully")
             event.accept()
@@ -3194,8 +4298,20 @@ class SlideshowManager(QMainWindow):
             logger.error(f"Error during close: {e}")
             event.accept()
 
+def log_imaging_backend():
+    """Log whether thumbnail decoding gets the accelerated Pillow/libjpeg code paths."""
+    logger.info(f"Pillow {PIL.__version__}, libjpeg {features.version('jpg')}")
+    if not PILLOW_SIMD:
+        logger.warning("Pillow-SIMD not installed; thumbnail resizing uses the slower stock kernels (see README)")
+    if not features.check('libjpeg_turbo'):
+        logger.warning("Pillow is not built against libjpeg-turbo; JPEG thumbnails will decode slowly")
+
+
 def main():
+    # Only the VLC video surface needs a native window; keep its siblings alien too
+    QApplication.setAttribute(Qt.AA_DontCreateNativeWidgetSiblings)
     app = QApplication(sys.argv)
+    log_imaging_backend()
 
     # Handle Ctrl-C gracefully
     import signal